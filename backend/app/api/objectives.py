@@ -1,6 +1,7 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..models.objective import ObjectiveCreate, ObjectiveUpdate, ObjectiveResponse
@@ -20,19 +21,21 @@ def read_objectives(
     skip: int = 0, 
     limit: int = 100,
     category: TaskCategory = None,
+    after: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get all objectives with optional filtering
+    Get all objectives with optional filtering, ordered by ID
     
     - **skip**: Number of objectives to skip (pagination)
     - **limit**: Maximum number of objectives to return
     - **category**: Filter by objective category
+    - **after**: Return objectives after this ID (keyset pagination, overrides skip)
     """
     if category:
         return ObjectiveService.get_objectives_by_category(db, category)
     else:
-        return ObjectiveService.get_objectives(db, skip, limit)
+        return ObjectiveService.get_objectives(db, skip, limit, after)
 
 @router.get("/{objective_id}", response_model=ObjectiveResponse)
 def read_objective(objective_id: str, db: Session = Depends(get_db)):
@@ -92,8 +95,9 @@ def normalize_objective_weights(db: Session = Depends(get_db)):
 def get_objective_progress_percentages(db: Session = Depends(get_db)):
     """Get progress percentages for all objectives"""
     progress = ObjectiveService.get_progress_percentages(db)
-    # Convert UUID keys to strings for JSON serialization
-    return {str(obj_id): percent for obj_id, percent in progress.items()}
+    # Objective IDs are already strings, so hand the dict straight to orjson
+    # instead of copying it and validating it against the response model
+    return ORJSONResponse(progress)
 
 @router.get("/progress/overall", response_model=float)
 def get_overall_progress(db: Session = Depends(get_db)):
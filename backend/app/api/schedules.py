@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, status, Body
 from sqlalchemy.orm import Session
@@ -16,14 +16,20 @@ def create_schedule(schedule: ScheduleCreate, db: Session = Depends(get_db)):
     return ScheduleService.create_schedule(db, schedule)
 
 @router.get("/", response_model=List[ScheduleResponse])
-def read_schedules(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def read_schedules(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
     """
-    Get all schedules with pagination
+    Get all schedules with pagination, ordered by ID
     
     - **skip**: Number of schedules to skip (pagination)
     - **limit**: Maximum number of schedules to return
+    - **after**: Return schedules after this ID (keyset pagination, overrides skip)
     """
-    return ScheduleService.get_schedules(db, skip, limit)
+    return ScheduleService.get_schedules(db, skip, limit, after)
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 def read_schedule(schedule_id: str, db: Session = Depends(get_db)):
@@ -89,11 +95,11 @@ def check_schedule_feasibility(
     - **schedule_id**: ID of the schedule to check
     - **constraints**: Time and resource constraints to validate against
     """
-    schedule = ScheduleService.get_schedule(db, schedule_id)
-    if schedule is None:
+    feasible = ScheduleService.check_schedule_feasibility(db, schedule_id, constraints)
+    if feasible is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Schedule not found"
         )
     
-    return ScheduleService.check_schedule_feasibility(db, schedule_id, constraints)
\ No newline at end of file
+    return feasible
\ No newline at end of file
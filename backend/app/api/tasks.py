@@ -21,31 +21,20 @@ def read_tasks(
     status: Optional[TaskStatus] = None,
     category: Optional[TaskCategory] = None,
     min_priority: Optional[int] = None,
+    after: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get all tasks with optional filtering
+    Get all tasks with optional filtering, ordered by ID
     
     - **skip**: Number of tasks to skip (pagination)
     - **limit**: Maximum number of tasks to return
     - **status**: Filter by task status
     - **category**: Filter by task category
     - **min_priority**: Filter by minimum priority level
+    - **after**: Return tasks after this ID (keyset pagination, overrides skip)
     """
-    # Basic tasks fetch with pagination
-    tasks = TaskService.get_tasks(db, skip, limit)
-    
-    # Apply filters if provided
-    if status:
-        tasks = [t for t in tasks if t.status == status]
-    
-    if category:
-        tasks = [t for t in tasks if t.category == category]
-    
-    if min_priority:
-        tasks = [t for t in tasks if t.priority >= min_priority]
-    
-    return tasks
+    return TaskService.get_tasks(db, skip, limit, status, category, min_priority, after)
 
 @router.get("/{task_id}", response_model=TaskResponse)
 def read_task(task_id: str, db: Session = Depends(get_db)):
@@ -0,0 +1,52 @@
+import numpy as np
+from numba import njit
+
+@njit
+def dominated_mask(scores):
+    """
+    Flag the dominated rows of a score matrix.
+    
+    Rows must be ordered so that a dominating row always comes before the rows
+    it dominates (e.g. by decreasing total score). The rows are then swept once
+    while keeping the non-dominated rows seen so far: a dominated earlier row
+    has a dominator on that running front, which dominates everything it does,
+    so each row only needs checking against the front. Each comparison stops
+    at the first objective that rules it out.
+    
+    Args:
+        scores: (N, M) float matrix of objective scores, in dominance order
+        
+    Returns:
+        Boolean array where [i] is True if row i is dominated
+    """
+    n, m = scores.shape
+    out = np.zeros(n, dtype=np.bool_)
+    
+    # Row indices of the running front, in order
+    front = np.empty(n, dtype=np.int64)
+    front_size = 0
+    
+    for i in range(n):
+        for f in range(front_size):
+            j = front[f]
+            at_least_as_good = True
+            strictly_better = False
+            
+            for k in range(m):
+                a = scores[i, k]
+                b = scores[j, k]
+                if b < a:
+                    at_least_as_good = False
+                    break
+                elif b > a:
+                    strictly_better = True
+            
+            if at_least_as_good and strictly_better:
+                out[i] = True
+                break
+        
+        if not out[i]:
+            front[front_size] = i
+            front_size += 1
+    
+    return out
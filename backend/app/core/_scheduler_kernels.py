@@ -0,0 +1,85 @@
+import numpy as np
+from numba import njit
+
+MINUTES_PER_DAY = 24 * 60
+
+@njit(boundscheck=False)
+def feasibility_kernel(starts, durations, slot_starts, slot_ends, slot_weekdays,
+                       first_weekday, daily_cap, weekly_cap, dep_tasks, dep_positions):
+    """
+    Check the numeric feasibility rules of a schedule.
+    
+    Times are whole minutes since midnight of the schedule's first day, so
+    day d of the schedule covers [d * 1440, (d + 1) * 1440).
+    
+    Args:
+        starts: (N,) task start times
+        durations: (N,) task durations in minutes
+        slot_starts: (K,) slot start times in minutes since midnight
+        slot_ends: (K,) slot end times in minutes since midnight (past 1440 if the slot crosses midnight)
+        slot_weekdays: (K,) weekday of each slot, Monday = 0
+        first_weekday: weekday of day 0, Monday = 0
+        daily_cap: maximum minutes of work per day
+        weekly_cap: maximum minutes of work overall
+        dep_tasks: (D,) position of the dependent task of each dependency
+        dep_positions: (D,) position of the task it depends on, -1 if that
+            task isn't in the schedule
+    
+    Returns:
+        True if every task sits in an available slot, the daily and weekly
+        limits hold, every dependency finishes before its dependent task
+        starts and no two tasks overlap
+    """
+    n = starts.shape[0]
+    if n == 0:
+        return True
+    
+    # Every task must fit into an available slot of its day
+    for i in range(n):
+        day = starts[i] // MINUTES_PER_DAY
+        weekday = (first_weekday + day) % 7
+        day_offset = day * MINUTES_PER_DAY
+        end = starts[i] + durations[i]
+        
+        fits = False
+        for k in range(slot_starts.shape[0]):
+            if (slot_weekdays[k] == weekday
+                    and day_offset + slot_starts[k] <= starts[i]
+                    and end <= day_offset + slot_ends[k]):
+                fits = True
+                break
+        
+        if not fits:
+            return False
+    
+    # Daily and weekly time limits
+    daily_minutes = np.zeros(starts.max() // MINUTES_PER_DAY + 1, dtype=np.int64)
+    weekly_total = 0
+    
+    for i in range(n):
+        day = starts[i] // MINUTES_PER_DAY
+        daily_minutes[day] += durations[i]
+        weekly_total += durations[i]
+        
+        if daily_minutes[day] > daily_cap:
+            return False
+    
+    if weekly_total > weekly_cap:
+        return False
+    
+    # Dependencies must be scheduled and finished before the task starts
+    for d in range(dep_tasks.shape[0]):
+        dep = dep_positions[d]
+        if dep < 0 or starts[dep_tasks[d]] < starts[dep] + durations[dep]:
+            return False
+    
+    # No two tasks may overlap; once sorted by start time any overlap
+    # shows up between neighbours
+    order = np.argsort(starts)
+    
+    for idx in range(1, n):
+        prev = order[idx - 1]
+        if starts[order[idx]] < starts[prev] + durations[prev]:
+            return False
+    
+    return True
@@ -0,0 +1,44 @@
+import numpy as np
+from numba import njit
+
+# Compiled lazily on the first call, like the other kernels, so importing the
+# app doesn't pay for it. Score matrices are small, so the columns are scaled
+# serially rather than on a thread pool
+@njit
+def normalize_columns(raw):
+    """
+    Min-max scale each column of a score matrix to the 0-1 range.
+    
+    A column whose values are all equal has nothing to scale; its positive
+    entries become 1.0 and the rest 0.0.
+    
+    Args:
+        raw: (N, M) float matrix of raw scores, N >= 1
+        
+    Returns:
+        (N, M) float matrix of normalized scores
+    """
+    n, m = raw.shape
+    out = np.empty_like(raw)
+    
+    for j in range(m):
+        lo = raw[0, j]
+        hi = raw[0, j]
+        for i in range(1, n):
+            value = raw[i, j]
+            if value < lo:
+                lo = value
+            elif value > hi:
+                hi = value
+        
+        spread = hi - lo
+        
+        for i in range(n):
+            if spread > 0:
+                out[i, j] = (raw[i, j] - lo) / spread
+            elif raw[i, j] > 0:
+                out[i, j] = 1.0
+            else:
+                out[i, j] = 0.0
+    
+    return out
@@ -0,0 +1,42 @@
+from typing import Dict, Hashable, Iterable, Tuple
+import threading
+
+class ObjectiveRegistry:
+    """
+    Process-wide mapping of objective IDs to contiguous integer indices.
+    
+    Objectives are registered when they are created (or the first time a
+    schedule scored against them shows up), which gives every objective a
+    fixed column in score arrays without sorting or hashing UUID strings
+    over and over.
+    """
+    
+    def __init__(self):
+        self._indices: Dict[Hashable, int] = {}
+        self._orderings: Dict[Tuple[Hashable, ...], Tuple[Hashable, ...]] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, objective_id: Hashable) -> int:
+        """Get the index of an objective, registering it if it is new"""
+        index = self._indices.get(objective_id)
+        if index is not None:
+            return index
+        
+        with self._lock:
+            return self._indices.setdefault(objective_id, len(self._indices))
+    
+    def ordering(self, objective_ids: Iterable[Hashable]) -> Tuple[Hashable, ...]:
+        """
+        Order a set of objective IDs by their registry index.
+        
+        Equal orderings are interned, so schedules scored on the same
+        objectives share one tuple and can be matched with an identity check.
+        """
+        ordering = tuple(sorted(objective_ids, key=self.register))
+        return self._orderings.setdefault(ordering, ordering)
+    
+    def __len__(self) -> int:
+        return len(self._indices)
+
+# Shared by the services and the Pareto code
+objective_registry = ObjectiveRegistry()
@@ -1,6 +1,61 @@
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Optional
 import uuid
+import numpy as np
 from ..models.schedule import Schedule
+from ._pareto_kernels import dominated_mask
+from .objective_registry import objective_registry
+from .pareto_gpu import use_gpu, dominated_mask_gpu
+
+# Up to this many objectives is_dominated compares the scores one by one in
+# Python, which beats two NumPy reductions on such short vectors
+_SCALAR_COMPARE_MAX = 16
+
+# Upper bound on the (rows, N, M) comparison intermediates of one block of
+# pairwise dominance checks
+_DOMINANCE_BLOCK_BYTES = 64 * 1024 * 1024
+
+def _score_entry(schedule: Schedule) -> Tuple[Dict[str, float], Tuple[str, ...], np.ndarray, float, List[float]]:
+    """
+    Get the cached score entry of a schedule, building it if the scores changed.
+    
+    The objective IDs are kept in registry order so arrays of schedules with
+    the same objectives line up. The entry is cached on the schedule and rebuilt
+    whenever objective_scores is reassigned, so the dict is only walked once
+    no matter how many dominance checks the schedule takes part in. In-place
+    edits to the dict clear the entry through the column's change hook.
+    
+    Args:
+        schedule: Schedule to read the scores from
+        
+    Returns:
+        Tuple of the scores dict the entry was built from, the ordered
+        objective IDs, the matching scores as an array, their sum and the
+        scores as a list of floats
+    """
+    scores = schedule.objective_scores
+    cached = getattr(schedule, "_scores_arr", None)
+    
+    if cached is None or cached[0] is not scores:
+        obj_ids = objective_registry.ordering(scores)
+        values = np.fromiter((scores[obj_id] for obj_id in obj_ids),
+                             dtype=np.float64, count=len(obj_ids))
+        cached = (scores, obj_ids, values, float(values.sum()), values.tolist())
+        schedule._scores_arr = cached
+    
+    return cached
+
+def _score_array(schedule: Schedule) -> Tuple[Tuple[str, ...], np.ndarray, float]:
+    """
+    Get a schedule's objective scores as a float array.
+    
+    Args:
+        schedule: Schedule to read the scores from
+        
+    Returns:
+        Tuple of the ordered objective IDs, the matching scores and their sum
+    """
+    _, obj_ids, values, total, _ = _score_entry(schedule)
+    return obj_ids, values, total
 
 def is_dominated(schedule_a: Schedule, schedule_b: Schedule) -> bool:
     """
@@ -15,33 +70,34 @@ def is_dominated(schedule_a: Schedule, schedule_b: Schedule) -> bool:
     Returns:
         True if schedule_a is dominated by schedule_b, False otherwise
     """
-    # Extract objective scores for each schedule
-    scores_a = schedule_a.objective_scores
-    scores_b = schedule_b.objective_scores
+    # Compare the cached scores rather than walking the score dicts
+    _, obj_ids_a, scores_a, total_a, list_a = _score_entry(schedule_a)
+    _, obj_ids_b, scores_b, total_b, list_b = _score_entry(schedule_b)
     
-    # Both schedules must have the same objectives to compare
-    if set(scores_a.keys()) != set(scores_b.keys()):
+    # Both schedules must have the same objectives to compare; the orderings
+    # are interned, so the identity check settles the common case
+    if obj_ids_a is not obj_ids_b and obj_ids_a != obj_ids_b:
         raise ValueError("Schedules must have the same objectives to compare dominance")
     
-    # Check if schedule_b dominates schedule_a
-    # 1. schedule_b must be at least as good as schedule_a for all objectives
-    # 2. schedule_b must be strictly better than schedule_a for at least one objective
-    at_least_one_better = False
+    # A dominating schedule can never have a smaller total, which rules out
+    # most pairs without comparing each objective
+    if total_b < total_a:
+        return False
     
-    for obj_id, score_a in scores_a.items():
-        score_b = scores_b[obj_id]
-        
-        # If schedule_a has a better score for any objective, it's not dominated
-        if score_a > score_b:
+    # schedule_b dominates schedule_a if it is at least as good for all objectives
+    # and strictly better for at least one of them
+    if len(list_a) > _SCALAR_COMPARE_MAX:
+        return bool(np.all(scores_b >= scores_a) and np.any(scores_b > scores_a))
+    
+    # Stop at the first objective where schedule_b is worse
+    strictly_better = False
+    for a, b in zip(list_a, list_b):
+        if b < a:
             return False
-        
-        # Check if schedule_b is strictly better for this objective
-        if score_b > score_a:
-            at_least_one_better = True
+        if b > a:
+            strictly_better = True
     
-    # If we got here, schedule_b is at least as good as schedule_a for all objectives
-    # Return True only if schedule_b is strictly better for at least one objective
-    return at_least_one_better
+    return strictly_better
 
 def is_dominated_by_any(schedule: Schedule, other_schedules: List[Schedule]) -> bool:
     """
@@ -54,7 +110,199 @@ def is_dominated_by_any(schedule: Schedule, other_schedules: List[Schedule]) ->
     Returns:
         True if the schedule is dominated by any schedule in the list, False otherwise
     """
-    return any(is_dominated(schedule, other) for other in other_schedules)
+    if not other_schedules:
+        return False
+    
+    # Compare against all other schedules in one vectorized reduction
+    obj_ids, scores, _ = _score_array(schedule)
+    other_scores, other_obj_ids = _score_matrix(other_schedules)
+    
+    if other_obj_ids != list(obj_ids):
+        raise ValueError("Schedules must have the same objectives to compare dominance")
+    
+    return is_dominated_by_any_vec(scores, other_scores)
+
+def is_dominated_by_any_vec(scores: np.ndarray, other_scores: np.ndarray) -> bool:
+    """
+    Check if a score vector is dominated by any row of a score matrix.
+    
+    Args:
+        scores: (M,) scores of the schedule to check
+        other_scores: (N, M) scores of the schedules to compare against
+        
+    Returns:
+        True if any row of other_scores dominates scores, False otherwise
+    """
+    if len(other_scores) == 0:
+        return False
+    
+    at_least_as_good = (other_scores >= scores).all(axis=1)
+    strictly_better = (other_scores > scores).any(axis=1)
+    return bool((at_least_as_good & strictly_better).any())
+
+def _comparable_scores(schedule: Schedule,
+                       candidates: List[Schedule]) -> Tuple[np.ndarray, List[Schedule], np.ndarray]:
+    """
+    Stack the scores of the candidates that share a schedule's objectives.
+    
+    Candidates scored on other objectives cannot be compared and are left out.
+    
+    Args:
+        schedule: Schedule to compare
+        candidates: Schedules to compare it against
+        
+    Returns:
+        Tuple of the schedule's scores, the comparable candidates and their (K, M) scores
+    """
+    obj_ids, scores, _ = _score_array(schedule)
+    comparable = [c for c in candidates if _score_array(c)[0] is obj_ids]
+    
+    matrix = np.empty((len(comparable), len(obj_ids)), dtype=np.float64)
+    for i, candidate in enumerate(comparable):
+        matrix[i] = _score_array(candidate)[1]
+    
+    return scores, comparable, matrix
+
+def find_dominator(schedule: Schedule, candidates: List[Schedule]) -> Optional[Schedule]:
+    """
+    Find a schedule among the candidates that dominates the given schedule.
+    
+    Args:
+        schedule: Schedule to check
+        candidates: Schedules to compare against, usually the current Pareto front
+        
+    Returns:
+        The first dominating candidate, or None if the schedule is not dominated
+    """
+    scores, comparable, matrix = _comparable_scores(schedule, candidates)
+    
+    dominating = (matrix >= scores).all(axis=1) & (matrix > scores).any(axis=1)
+    hits = np.flatnonzero(dominating)
+    return comparable[hits[0]] if len(hits) else None
+
+def find_dominated(schedule: Schedule, candidates: List[Schedule]) -> List[Schedule]:
+    """
+    Find the candidates that are dominated by the given schedule.
+    
+    Args:
+        schedule: Schedule to compare
+        candidates: Schedules to check, usually the current Pareto front
+        
+    Returns:
+        List of candidates the schedule dominates
+    """
+    scores, comparable, matrix = _comparable_scores(schedule, candidates)
+    
+    dominated = (scores >= matrix).all(axis=1) & (scores > matrix).any(axis=1)
+    return [comparable[i] for i in np.flatnonzero(dominated)]
+
+def _score_matrix(schedules: List[Schedule]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Stack the objective scores of several schedules into one matrix.
+    
+    Columns follow the registry ordering of the objective IDs, so
+    row i holds the scores of schedules[i] for every objective.
+    
+    Args:
+        schedules: List of schedules sharing the same objectives
+        
+    Returns:
+        Tuple of the (N, M) float matrix and the objective IDs for its columns
+    """
+    if not schedules:
+        return np.empty((0, 0), dtype=np.float64), []
+    
+    obj_ids, _, _ = _score_array(schedules[0])
+    matrix = np.empty((len(schedules), len(obj_ids)), dtype=np.float64)
+    
+    for i, schedule in enumerate(schedules):
+        schedule_obj_ids, values, _ = _score_array(schedule)
+        
+        # Same rule as is_dominated: schedules must share their objectives
+        if schedule_obj_ids is not obj_ids and schedule_obj_ids != obj_ids:
+            raise ValueError("Schedules must have the same objectives to compare dominance")
+        
+        matrix[i] = values
+    
+    return matrix, list(obj_ids)
+
+def _domination_counts(scores: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """
+    Count, for every row of a score matrix, how many of the given rows dominate it.
+    
+    The given rows are compared a block at a time, so the broadcast comparisons
+    stay within _DOMINANCE_BLOCK_BYTES instead of growing as N * N * M, and the
+    (N, N) dominance matrix itself is never built.
+    
+    Args:
+        scores: (N, M) matrix of objective scores
+        rows: Indices of the candidate dominating rows
+        
+    Returns:
+        Integer array where [j] is the number of the given rows that dominate row j
+    """
+    n, m = scores.shape
+    block = max(1, _DOMINANCE_BLOCK_BYTES // max(1, n * m))
+    counts = np.zeros(n, dtype=np.int64)
+    
+    for start in range(0, len(rows), block):
+        candidates = scores[rows[start:start + block], None, :]
+        ge = (candidates >= scores[None, :, :]).all(axis=-1)
+        gt = (candidates > scores[None, :, :]).any(axis=-1)
+        # A row never dominates itself, as it is not strictly better anywhere
+        counts += (ge & gt).sum(axis=0)
+    
+    return counts
+
+def _dominance_order(scores: np.ndarray) -> np.ndarray:
+    """
+    Order rows so that every dominating row comes before the rows it dominates.
+    
+    Rows are sorted by decreasing total score, ties broken by decreasing
+    lexicographic order (floating-point totals of a dominating and a dominated
+    row can round to the same value).
+    
+    Args:
+        scores: (N, M) matrix of objective scores
+        
+    Returns:
+        Array of row indices in dominance order
+    """
+    keys = [-scores[:, j] for j in reversed(range(scores.shape[1]))]
+    return np.lexsort(keys + [-scores.sum(axis=1)])
+
+def _dominated_mask_2d(scores: np.ndarray) -> np.ndarray:
+    """
+    Flag the dominated rows of a two-objective score matrix in one sorted sweep.
+    
+    With rows sorted by decreasing first and then second score, only earlier
+    rows can dominate a row, and an earlier row does unless it is identical.
+    So a row is dominated iff the best second score among the rows before its
+    group of identical rows is at least its own second score.
+    
+    Args:
+        scores: (N, 2) float matrix of objective scores, in any order
+        
+    Returns:
+        Boolean array where [i] is True if row i is dominated
+    """
+    n = len(scores)
+    order = np.lexsort((-scores[:, 1], -scores[:, 0]))
+    ordered = scores[order]
+    
+    # Position of the first row of each row's group of identical rows
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(n), 0))
+    
+    # Best second score strictly before each position
+    best_before = np.empty(n, dtype=np.float64)
+    best_before[0] = -np.inf
+    best_before[1:] = np.maximum.accumulate(ordered[:-1, 1])
+    
+    dominated = np.empty(n, dtype=bool)
+    dominated[order] = best_before[group_start] >= ordered[:, 1]
+    return dominated
 
 def calculate_pareto_front(schedules: List[Schedule]) -> List[Schedule]:
     """
@@ -76,21 +324,25 @@ def calculate_pareto_front(schedules: List[Schedule]) -> List[Schedule]:
     if not schedules:
         raise ValueError("Cannot calculate Pareto front of empty schedule list")
     
+    # Build the (N, M) score matrix once and find the dominated rows; in
+    # dominance order each row only has to be checked against the non-dominated
+    # rows before it
+    scores, _ = _score_matrix(schedules)
+    
+    if scores.shape[1] == 2:
+        # Two objectives need no pairwise comparisons at all
+        dominated = _dominated_mask_2d(scores)
+    elif use_gpu(len(schedules)):
+        # Large candidate sets are compared all-pairs on the GPU instead
+        dominated = dominated_mask_gpu(scores)
+    else:
+        order = _dominance_order(scores)
+        dominated = np.empty(len(schedules), dtype=bool)
+        dominated[order] = dominated_mask(np.ascontiguousarray(scores[order]))
+    
     pareto_front = []
     
-    # First pass: find all non-dominated schedules
-    for i, schedule in enumerate(schedules):
-        # Check if this schedule is dominated by any other schedule
-        is_dominated_flag = False
-        
-        for j, other_schedule in enumerate(schedules):
-            if i == j:  # Skip comparing to itself
-                continue
-                
-            if is_dominated(schedule, other_schedule):
-                is_dominated_flag = True
-                break
-        
+    for schedule, is_dominated_flag in zip(schedules, dominated):
         # If not dominated by any other schedule, add to Pareto front
         if not is_dominated_flag:
             # Update the schedule state
@@ -110,6 +362,27 @@ def calculate_pareto_ranks(schedules: List[Schedule]) -> Dict[int, List[Schedule
     Rank 0 is the Pareto front. Rank 1 is the Pareto front of the remaining schedules
     after removing rank 0, and so on.
     
+    Args:
+        schedules: List of schedules to rank
+        
+    Returns:
+        Dictionary mapping ranks to lists of schedules at that rank
+    """
+    return fast_non_dominated_sort(schedules)
+
+def fast_non_dominated_sort(schedules: List[Schedule]) -> Dict[int, List[Schedule]]:
+    """
+    Rank schedules into successive Pareto fronts in two dominance passes.
+    
+    This is the NSGA-II non-dominated sort in vectorized form: count how many
+    schedules dominate each schedule, then peel the fronts off by subtracting
+    the counts contributed by each front. Every step is a blocked NumPy
+    reduction, so memory stays O(N) plus one bounded block of comparisons
+    rather than an N x N matrix, at the cost of comparing each schedule's row
+    twice (once for the initial counts, once when its front is peeled). Unlike
+    recomputing the Pareto front on the remaining schedules for every rank,
+    that is still a fixed number of passes over all pairs.
+    
     Args:
         schedules: List of schedules to rank
         
@@ -119,27 +392,28 @@ def calculate_pareto_ranks(schedules: List[Schedule]) -> Dict[int, List[Schedule
     if not schedules:
         return {}
     
-    # Make a copy to avoid modifying the input
-    remaining = schedules.copy()
+    scores, _ = _score_matrix(schedules)
+    
+    # How many schedules dominate each schedule; ranked schedules drop to -1
+    domination_count = _domination_counts(scores, np.arange(len(schedules)))
+    
     ranks = {}
     rank = 0
+    # Indices come back ascending, which keeps the input order within each rank
+    current = np.flatnonzero(domination_count == 0)
     
-    # Calculate each Pareto front and remove it from consideration
-    while remaining:
-        # Calculate current Pareto front
-        front = calculate_pareto_front(remaining)
-        
+    while len(current):
         # Set rank for these schedules
-        for schedule in front:
-            schedule.pareto_rank = rank
+        for i in current.tolist():
+            schedules[i].pareto_rank = rank
+            schedules[i].is_dominated = rank > 0
         
-        # Store this front
-        ranks[rank] = front
+        ranks[rank] = [schedules[i] for i in current.tolist()]
         
-        # Remove these from consideration for the next rank
-        remaining = [s for s in remaining if s not in front]
-        
-        # Move to next rank
+        # Schedules only dominated by this front make up the next one
+        domination_count -= _domination_counts(scores, current)
+        domination_count[current] = -1
+        current = np.flatnonzero(domination_count == 0)
         rank += 1
     
     return ranks
@@ -157,27 +431,27 @@ def normalize_scores(schedules: List[Schedule]) -> None:
     if not schedules:
         return
     
-    # First, find all unique objective IDs
-    all_objectives = set()
-    for schedule in schedules:
-        all_objectives.update(schedule.objective_scores.keys())
-    
-    # For each objective, find min and max values
-    for obj_id in all_objectives:
-        scores = [schedule.objective_scores.get(obj_id, 0) for schedule in schedules]
-        min_score = min(scores)
-        max_score = max(scores)
-        
-        # Avoid division by zero if all scores are the same
-        if max_score == min_score:
-            # If all the same, set to 1.0 (perfect score)
-            for schedule in schedules:
-                if obj_id in schedule.objective_scores:
-                    schedule.objective_scores[obj_id] = 1.0
-        else:
-            # Normalize to 0-1 scale
-            range_score = max_score - min_score
-            for schedule in schedules:
-                if obj_id in schedule.objective_scores:
-                    normalized = (schedule.objective_scores[obj_id] - min_score) / range_score
-                    schedule.objective_scores[obj_id] = normalized
\ No newline at end of file
+    # Lay all scores out in one (N, M) matrix; missing scores count as 0
+    obj_ids = sorted({obj_id for schedule in schedules for obj_id in schedule.objective_scores})
+    columns = {obj_id: j for j, obj_id in enumerate(obj_ids)}
+    
+    scores = np.zeros((len(schedules), len(obj_ids)), dtype=np.float64)
+    for i, schedule in enumerate(schedules):
+        for obj_id, score in schedule.objective_scores.items():
+            scores[i, columns[obj_id]] = score
+    
+    # Min-max scale every objective column at once
+    min_scores = scores.min(axis=0)
+    score_range = scores.max(axis=0) - min_scores
+    constant = score_range == 0
+    
+    # If all scores for an objective are the same, set them to 1.0 (perfect score)
+    normalized = np.where(constant, 1.0, (scores - min_scores) / np.where(constant, 1.0, score_range))
+    
+    # Assign each schedule a new dict: every score changes, and one
+    # reassignment is cheaper than a change event per edited key
+    for i, schedule in enumerate(schedules):
+        row = normalized[i]
+        schedule.objective_scores = {
+            obj_id: float(row[columns[obj_id]]) for obj_id in schedule.objective_scores
+        }
\ No newline at end of file
@@ -0,0 +1,49 @@
+import numpy as np
+
+# CuPy is optional; without it (or without a usable GPU) the Pareto code
+# stays on the CPU kernel
+try:
+    import cupy as cp
+    GPU_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    GPU_AVAILABLE = False
+
+# Below this many schedules the upload and kernel launches cost more than
+# the CPU kernel saves
+GPU_MIN_SCHEDULES = 2000
+
+# Upper bound on the size of one block of pairwise comparisons on the GPU
+_BLOCK_BYTES = 256 * 1024 * 1024
+
+def use_gpu(n_schedules: int) -> bool:
+    """Whether a Pareto computation over n_schedules should run on the GPU"""
+    return GPU_AVAILABLE and n_schedules >= GPU_MIN_SCHEDULES
+
+def dominated_mask_gpu(scores: np.ndarray) -> np.ndarray:
+    """
+    Flag the dominated rows of a score matrix on the GPU.
+    
+    Every row is compared against every other row with broadcast comparisons,
+    a block of rows at a time so the (rows, N, M) intermediates fit in device
+    memory. Scores stay float64 so the result matches the CPU kernel exactly.
+    
+    Args:
+        scores: (N, M) float matrix of objective scores, in any order
+    
+    Returns:
+        Boolean array where [i] is True if row i is dominated
+    """
+    n, m = scores.shape
+    block = max(1, _BLOCK_BYTES // max(1, n * m))
+    
+    device_scores = cp.asarray(scores, dtype=cp.float64)
+    dominated = cp.empty(n, dtype=cp.bool_)
+    
+    for start in range(0, n, block):
+        rows = device_scores[start:start + block, None, :]
+        at_least_as_good = cp.all(device_scores[None, :, :] >= rows, axis=2)
+        strictly_better = cp.any(device_scores[None, :, :] > rows, axis=2)
+        dominated[start:start + block] = cp.any(at_least_as_good & strictly_better, axis=1)
+    
+    return cp.asnumpy(dominated)
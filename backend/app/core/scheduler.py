@@ -1,26 +1,176 @@
-from typing import List, Dict, Set, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional, NamedTuple, Callable
 from datetime import datetime, timedelta, time
 import random
+import heapq
 import uuid
 import itertools
-from ..models.task import Task
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from collections import defaultdict
+import numpy as np
+from ._scheduler_kernels import feasibility_kernel, MINUTES_PER_DAY
+from ..models.task import Task, TaskCategory
 from ..models.objective import Objective
-from ..models.schedule import Schedule, ScheduleTaskInfo
+from ..models.schedule import Schedule
 from ..models.constraints import TimeConstraints, TimeSlot, DayOfWeek
 
+# DayOfWeek by datetime.weekday() number (Monday = 0), and the reverse map
+# for code that works with plain integer weekdays
+_WEEKDAY_TO_DOW = (
+    DayOfWeek.MONDAY,
+    DayOfWeek.TUESDAY,
+    DayOfWeek.WEDNESDAY,
+    DayOfWeek.THURSDAY,
+    DayOfWeek.FRIDAY,
+    DayOfWeek.SATURDAY,
+    DayOfWeek.SUNDAY,
+)
+_DOW_TO_WEEKDAY = {day: i for i, day in enumerate(_WEEKDAY_TO_DOW)}
+
 # Helper functions to convert between datetime and day of week
 def datetime_to_day_of_week(dt: datetime) -> DayOfWeek:
     """Convert datetime to DayOfWeek enum value"""
-    day_map = {
-        0: DayOfWeek.MONDAY,
-        1: DayOfWeek.TUESDAY,
-        2: DayOfWeek.WEDNESDAY,
-        3: DayOfWeek.THURSDAY,
-        4: DayOfWeek.FRIDAY,
-        5: DayOfWeek.SATURDAY,
-        6: DayOfWeek.SUNDAY,
-    }
-    return day_map[dt.weekday()]
+    return _WEEKDAY_TO_DOW[dt.weekday()]
+
+# Available slots per weekday number (Monday = 0) as (start, end) minutes
+# since midnight; slots that go past midnight end after 1440
+SlotsByDay = List[List[Tuple[int, int]]]
+
+def _time_to_minutes(t: time) -> int:
+    """Convert a time of day to minutes since midnight"""
+    return t.hour * 60 + t.minute
+
+def _index_slots_by_day(constraints: TimeConstraints) -> SlotsByDay:
+    """Group the available slots by weekday as minute ranges"""
+    slots_by_day = []
+    
+    for day in _WEEKDAY_TO_DOW:
+        day_slots = []
+        for slot in constraints.get_available_slots_for_day(day):
+            start = _time_to_minutes(slot.start_time)
+            end = _time_to_minutes(slot.end_time)
+            
+            # Handle slots that go past midnight
+            if end <= start:
+                end += MINUTES_PER_DAY
+            
+            day_slots.append((start, end))
+        slots_by_day.append(day_slots)
+    
+    return slots_by_day
+
+class _TaskArrays(NamedTuple):
+    """
+    The task attributes the generators use, laid out as parallel arrays.
+    
+    Generators work on positions into these arrays; Task objects are only
+    looked up again when a task is added to a schedule.
+    """
+    tasks: List[Task]
+    durations: np.ndarray  # minutes, int32
+    priorities: np.ndarray  # int32
+    category_codes: np.ndarray  # int8, numbered in order of first appearance
+    duration_list: List[int]  # durations as Python ints, for element-wise loops
+    # Positions of each task's dependencies; -1 for dependencies outside the task list
+    dependencies: List[List[int]]
+
+def _build_task_arrays(tasks: List[Task]) -> _TaskArrays:
+    """Pull the scheduling attributes out of the tasks in one pass"""
+    positions = {task.id: i for i, task in enumerate(tasks)}
+    category_index: Dict[TaskCategory, int] = {}
+    
+    durations = np.array([task.duration for task in tasks], dtype=np.int32)
+    priorities = np.array([task.priority for task in tasks], dtype=np.int32)
+    category_codes = np.array(
+        [category_index.setdefault(task.category, len(category_index)) for task in tasks],
+        dtype=np.int8  # TaskCategory has 8 members
+    )
+    
+    return _TaskArrays(
+        tasks=tasks,
+        durations=durations,
+        priorities=priorities,
+        category_codes=category_codes,
+        duration_list=durations.tolist(),
+        dependencies=[[positions.get(dep.id, -1) for dep in task.dependencies] for task in tasks],
+    )
+
+class _PlacementLog:
+    """
+    Track the tasks a generator places and whether the schedule stays feasible.
+    
+    Generators only place a task where it fits into a slot and once its
+    dependencies have finished, so what is left to check are the daily and
+    weekly limits, which are updated as each task is placed. The placed
+    intervals are kept sorted too, since nothing stops a day's slots from
+    overlapping each other.
+    """
+    
+    def __init__(self, task_arrays: _TaskArrays, constraints: TimeConstraints):
+        self.durations = task_arrays.duration_list
+        self.max_daily_minutes = constraints.max_daily_work_minutes
+        self.max_weekly_minutes = constraints.max_weekly_work_minutes
+        self.daily_minutes: Dict[int, int] = defaultdict(int)
+        self.weekly_minutes = 0
+        # Minutes since the start date, by task position
+        self.start_times: Dict[int, int] = {}
+        self.end_times: Dict[int, int] = {}
+        # Placed (start, end) intervals as parallel lists sorted by start;
+        # they never overlap, so the ends are sorted as well
+        self.interval_starts: List[int] = []
+        self.interval_ends: List[int] = []
+        self.valid = True
+    
+    def busy_until(self, minute: int) -> int:
+        """The first minute from the given one on that no placed task covers"""
+        k = bisect_right(self.interval_starts, minute) - 1
+        
+        if k < 0 or self.interval_ends[k] <= minute:
+            return minute
+        
+        # Follow any back-to-back tasks after the covering one
+        minute = self.interval_ends[k]
+        for k in range(k + 1, len(self.interval_starts)):
+            if self.interval_starts[k] > minute:
+                break
+            minute = self.interval_ends[k]
+        
+        return minute
+    
+    def overlaps(self, start_time: int, end_time: int) -> bool:
+        """Whether a task over [start_time, end_time) would overlap a placed one"""
+        # Of the tasks starting before end_time, the last one ends latest
+        k = bisect_left(self.interval_starts, end_time)
+        return k > 0 and self.interval_ends[k - 1] > start_time
+    
+    def place(self, i: int, start_time: int, end_time: int) -> None:
+        """Record the task at position i, placed at the given minutes since the start date"""
+        day = start_time // MINUTES_PER_DAY
+        self.daily_minutes[day] += self.durations[i]
+        self.weekly_minutes += self.durations[i]
+        
+        if (self.daily_minutes[day] > self.max_daily_minutes
+                or self.weekly_minutes > self.max_weekly_minutes):
+            self.valid = False
+        
+        self.start_times[i] = start_time
+        self.end_times[i] = end_time
+        
+        k = bisect_right(self.interval_starts, start_time)
+        self.interval_starts.insert(k, start_time)
+        self.interval_ends.insert(k, end_time)
+
+def _new_schedule(name: str, start_date: datetime, end_date: datetime) -> Schedule:
+    """Create an empty generated schedule"""
+    return Schedule(
+        id=uuid.uuid4(),
+        name=name,
+        start_date=start_date,
+        end_date=end_date,
+        objective_scores={},
+        pareto_rank=0,
+        is_dominated=False,
+    )
 
 def generate_feasible_schedules(
     tasks: List[Task],
@@ -36,7 +186,8 @@ def generate_feasible_schedules(
         constraints: Time and resource constraints to respect
         
     Returns:
-        List of feasible schedules
+        List of feasible schedules; each carries a task_start_times dict
+        mapping its task IDs to their planned start times
         
     """
     if not tasks:
@@ -47,341 +198,287 @@ def generate_feasible_schedules(
     # For simplicity in this implementation, we'll generate a small number of schedules
     # In a real implementation, this would use a more sophisticated algorithm
     
-    # Sort tasks by priority (highest first)
-    prioritized_tasks = sorted(tasks, key=lambda t: t.priority, reverse=True)
+    # Look the slots of each weekday up once instead of once per generated day
+    slots_by_day = _index_slots_by_day(constraints)
+    
+    # All strategies plan the same week, starting today
+    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    end_date = start_date + timedelta(days=6)  # One week schedule
+    
+    # Read the task attributes once; the strategies below only reorder positions
+    task_arrays = _build_task_arrays(tasks)
+    
+    # Sort tasks by priority (highest first, ties keep their input order)
+    priority_order = np.argsort(-task_arrays.priorities, kind="stable").tolist()
     
     # Generate a few variations
-    # In reality, we'd use a more sophisticated algorithm with better variations
+    # In reality, we'd use a more sophisticated algorithm with better variations.
+    # Each generator reports whether its schedule met the constraints while
+    # placing tasks, so there's no separate feasibility pass afterwards
     schedules = []
     
     # Strategy 1: Pack highest priority tasks first
-    schedule1 = _generate_priority_schedule(prioritized_tasks, constraints)
-    if schedule1 and is_schedule_feasible(schedule1, constraints):
+    schedule1, valid1 = _generate_priority_schedule(priority_order, task_arrays, slots_by_day,
+                                                    constraints, start_date, end_date)
+    if schedule1 and valid1:
         schedules.append(schedule1)
     
     # Strategy 2: Pack tasks by category (group similar tasks)
-    schedule2 = _generate_category_schedule(tasks, constraints)
-    if schedule2 and is_schedule_feasible(schedule2, constraints):
+    schedule2, valid2 = _generate_category_schedule(task_arrays, slots_by_day, constraints, start_date, end_date)
+    if schedule2 and valid2:
         schedules.append(schedule2)
     
     # Strategy 3: Distribute tasks evenly
-    schedule3 = _generate_balanced_schedule(tasks, constraints)
-    if schedule3 and is_schedule_feasible(schedule3, constraints):
+    schedule3, valid3 = _generate_balanced_schedule(task_arrays, slots_by_day, constraints, start_date, end_date)
+    if schedule3 and valid3:
         schedules.append(schedule3)
     
     # Strategy 4: Random but valid schedule
-    schedule4 = _generate_random_schedule(tasks, constraints)
-    if schedule4 and is_schedule_feasible(schedule4, constraints):
+    schedule4, valid4 = _generate_random_schedule(task_arrays, slots_by_day, constraints, start_date, end_date)
+    if schedule4 and valid4:
         schedules.append(schedule4)
     
-    # Calculate objective scores for each schedule
-    for schedule in schedules:
-        scores = calculate_objective_scores(schedule, objectives)
-        schedule.objective_scores = {str(obj_id): score for obj_id, score in scores.items()}
+    # Score every schedule against every objective in one batch
+    obj_ids = [str(objective.id) for objective in objectives]
+    
+    for schedule, row in zip(schedules, _objective_score_matrix(schedules, objectives).tolist()):
+        schedule.objective_scores = dict(zip(obj_ids, row))
     
     return schedules
 
-def _generate_priority_schedule(tasks: List[Task], constraints: TimeConstraints) -> Optional[Schedule]:
-    """Generate a schedule focusing on high priority tasks first"""
-    # Sort tasks by priority (already done in caller)
-    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=6)  # One week schedule
-    
-    schedule = Schedule(
-        id=uuid.uuid4(),
-        name="Priority-Focused Schedule",
-        start_date=start_date,
-        end_date=end_date,
-        objective_scores={},
-        pareto_rank=0,
-        is_dominated=False,
-    )
+def _objective_score_matrix(schedules: List[Schedule], objectives: List[Objective]) -> np.ndarray:
+    """
+    Score several schedules against several objectives at once.
     
-    # Assign time slots based on priority
-    assigned_tasks = []
+    Gives the scores of calculate_objective_scores: the hours of each
+    objective's category over its target, clipped to the 0-1 range.
     
-    current_date = start_date
-    while current_date <= end_date and tasks:
-        day = datetime_to_day_of_week(current_date)
-        slots = constraints.get_available_slots_for_day(day)
-        
-        for slot in slots:
-            slot_start = datetime.combine(current_date.date(), slot.start_time)
-            slot_end = datetime.combine(current_date.date(), slot.end_time)
-            
-            # Handle slots that go past midnight
-            if slot.end_time <= slot.start_time:
-                slot_end += timedelta(days=1)
-            
-            remaining_tasks = [t for t in tasks if t not in assigned_tasks]
-            if not remaining_tasks:
-                break
-                
-            # Try to fit tasks into this slot
-            current_time = slot_start
-            while current_time < slot_end and remaining_tasks:
-                # Get next task
-                task = remaining_tasks[0]
-                
-                # Check if task fits in remaining time
-                task_end = current_time + timedelta(minutes=task.duration)
-                if task_end <= slot_end:
-                    assigned_tasks.append(task)
-                    schedule.tasks.append(task)
-                    # In reality we'd store the start time in the join table, but for simplicity
-                    # we'll just construct a ScheduleTaskInfo
-                    task_info = ScheduleTaskInfo(task_id=task.id, start_time=current_time)
-                    
-                    # Increment time
-                    current_time = task_end
-                else:
-                    # Move to next task
-                    remaining_tasks = remaining_tasks[1:]
-        
-        current_date += timedelta(days=1)
-    
-    # If we couldn't schedule any tasks, return None
-    if not schedule.tasks:
-        return None
+    Args:
+        schedules: Schedules to score
+        objectives: Objectives to score against
         
-    return schedule
+    Returns:
+        (S, O) float matrix where [i, j] is the score of schedule i for objective j
+    """
+    # One column per category some objective is about
+    columns: Dict[TaskCategory, int] = {}
+    obj_columns = [columns.setdefault(objective.category, len(columns)) for objective in objectives]
+    n_columns = len(columns)
+    
+    # Flat (schedule, category) cell and minutes of every relevant task
+    cells = []
+    durations = []
+    for i, schedule in enumerate(schedules):
+        for task in schedule.tasks:
+            column = columns.get(task.category)
+            if column is not None:
+                cells.append(i * n_columns + column)
+                durations.append(task.duration)
+    
+    minutes = np.bincount(np.array(cells, dtype=np.intp),
+                          weights=np.array(durations, dtype=np.float64),
+                          minlength=len(schedules) * n_columns)
+    hours = minutes.reshape(len(schedules), n_columns) / 60.0
+    
+    targets = np.array([objective.target_value or 1.0 for objective in objectives], dtype=np.float64)
+    return np.clip(hours[:, obj_columns] / targets, 0.0, 1.0)
 
-def _generate_category_schedule(tasks: List[Task], constraints: TimeConstraints) -> Optional[Schedule]:
-    """Generate a schedule grouping tasks by category"""
-    # Group tasks by category
-    category_tasks = {}
-    for task in tasks:
-        if task.category not in category_tasks:
-            category_tasks[task.category] = []
-        category_tasks[task.category].append(task)
+# End time of a task that hasn't been placed
+_NOT_PLACED = float("inf")
+
+def _pack(name: str, task_arrays: _TaskArrays, slots_by_day: SlotsByDay, constraints: TimeConstraints,
+          start_date: datetime, end_date: datetime, next_batch: Callable[[int, Set[int]], List[int]],
+          pick_slots: Optional[Callable[[List[Tuple[int, int]]], List[Tuple[int, int]]]] = None
+          ) -> Tuple[Optional[Schedule], bool]:
+    """
+    Place tasks into the available slots day by day.
     
-    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=6)  # One week schedule
+    This is the packing loop shared by every strategy. A strategy only
+    decides which tasks each slot is offered and in what order. Within a
+    slot, tasks are placed back to back at their earliest start: a task that
+    doesn't fit in the remaining time, would overlap a task placed from
+    another slot, or whose dependencies haven't finished yet, is skipped and
+    stays unassigned for later slots.
     
-    schedule = Schedule(
-        id=uuid.uuid4(),
-        name="Category-Focused Schedule",
-        start_date=start_date,
-        end_date=end_date,
-        objective_scores={},
-        pareto_rank=0,
-        is_dominated=False,
-    )
+    Args:
+        name: Name of the generated schedule
+        task_arrays: Task attributes by position
+        slots_by_day: Available (start, end) minute slots per weekday
+        constraints: Constraints the placements are checked against
+        start_date: Midnight of the first scheduled day
+        end_date: Midnight of the last scheduled day
+        next_batch: Called with the day index and the positions assigned so
+            far; returns the unassigned positions to try in the next slot,
+            in order. An empty batch ends the day
+        pick_slots: Chooses which of a day's slots to fill; all of them by default
+        
+    Returns:
+        The schedule (None if no task could be placed) and whether it met
+        the constraints
+    """
+    tasks = task_arrays.tasks
+    durations = task_arrays.duration_list
+    dependencies = task_arrays.dependencies
+    first_weekday = start_date.weekday()
+    days = (end_date - start_date).days + 1
     
-    # Assign time slots based on category
-    assigned_tasks = []
+    schedule = _new_schedule(name, start_date, end_date)
     
-    current_date = start_date
-    while current_date <= end_date:
-        day = datetime_to_day_of_week(current_date)
-        slots = constraints.get_available_slots_for_day(day)
+    placements = _PlacementLog(task_arrays, constraints)
+    end_times = placements.end_times
+    assigned: Set[int] = set()
+    
+    for day_index in range(days):
+        # Nothing left to place on the remaining days
+        if len(assigned) == len(tasks):
+            break
+        
+        day_offset = day_index * MINUTES_PER_DAY
+        slots = slots_by_day[(first_weekday + day_index) % 7]
+        if pick_slots is not None:
+            slots = pick_slots(slots)
         
-        for slot in slots:
-            slot_start = datetime.combine(current_date.date(), slot.start_time)
-            slot_end = datetime.combine(current_date.date(), slot.end_time)
+        for slot_start_min, slot_end_min in slots:
+            batch = next_batch(day_index, assigned)
+            if not batch:
+                break
             
-            # Handle slots that go past midnight
-            if slot.end_time <= slot.start_time:
-                slot_end += timedelta(days=1)
+            # Try to fit tasks into this slot
+            current_time = day_offset + slot_start_min
+            slot_end = day_offset + slot_end_min
             
-            # Distribute categories across slots - one category per slot for simplicity
-            current_category = None
-            for category, cat_tasks in category_tasks.items():
-                unassigned_tasks = [t for t in cat_tasks if t not in assigned_tasks]
-                if unassigned_tasks:
-                    current_category = category
+            for i in batch:
+                # An overlapping slot may already hold tasks here
+                current_time = placements.busy_until(current_time)
+                if current_time >= slot_end:
                     break
-            
-            if not current_category:
-                break
                 
-            # Try to fit tasks from this category into this slot
-            current_time = slot_start
-            unassigned_tasks = [t for t in category_tasks[current_category] if t not in assigned_tasks]
-            
-            while current_time < slot_end and unassigned_tasks:
-                # Get next task
-                task = unassigned_tasks[0]
+                # Dependencies must be placed, and finished, before the task
+                # starts; ones outside the task list never are
+                if any(end_times.get(dep, _NOT_PLACED) > current_time for dep in dependencies[i]):
+                    continue
                 
                 # Check if task fits in remaining time
-                task_end = current_time + timedelta(minutes=task.duration)
-                if task_end <= slot_end:
-                    assigned_tasks.append(task)
-                    schedule.tasks.append(task)
-                    # In reality we'd store the start time in the join table, but for simplicity
-                    # we'll just construct a ScheduleTaskInfo
-                    task_info = ScheduleTaskInfo(task_id=task.id, start_time=current_time)
+                task_end = current_time + durations[i]
+                if task_end <= slot_end and not placements.overlaps(current_time, task_end):
+                    assigned.add(i)
+                    schedule.tasks.append(tasks[i])
+                    placements.place(i, current_time, task_end)
                     
                     # Increment time
                     current_time = task_end
-                
-                # Move to next task
-                unassigned_tasks = unassigned_tasks[1:]
-        
-        current_date += timedelta(days=1)
     
     # If we couldn't schedule any tasks, return None
     if not schedule.tasks:
-        return None
+        return None, False
+    
+    # Keep the start times for the schedule_tasks rows
+    schedule.task_start_times = {
+        tasks[i].id: start_date + timedelta(minutes=start)
+        for i, start in placements.start_times.items()
+    }
         
-    return schedule
+    return schedule, placements.valid
 
-def _generate_balanced_schedule(tasks: List[Task], constraints: TimeConstraints) -> Optional[Schedule]:
-    """Generate a schedule balancing tasks evenly across days"""
-    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=6)  # One week schedule
-    
-    schedule = Schedule(
-        id=uuid.uuid4(),
-        name="Balanced Schedule",
-        start_date=start_date,
-        end_date=end_date,
-        objective_scores={},
-        pareto_rank=0,
-        is_dominated=False,
-    )
+def _generate_priority_schedule(order: List[int], task_arrays: _TaskArrays, slots_by_day: SlotsByDay,
+                                constraints: TimeConstraints, start_date: datetime,
+                                end_date: datetime) -> Tuple[Optional[Schedule], bool]:
+    """Generate a schedule focusing on high priority tasks first"""
+    # Task positions are sorted by priority (already done in caller)
+    def next_batch(day_index: int, assigned: Set[int]) -> List[int]:
+        return [i for i in order if i not in assigned]
     
-    # Calculate daily budget
-    total_task_minutes = sum(task.duration for task in tasks)
+    return _pack("Priority-Focused Schedule", task_arrays, slots_by_day, constraints,
+                 start_date, end_date, next_batch)
+
+def _generate_category_schedule(task_arrays: _TaskArrays, slots_by_day: SlotsByDay,
+                                constraints: TimeConstraints, start_date: datetime,
+                                end_date: datetime) -> Tuple[Optional[Schedule], bool]:
+    """Generate a schedule grouping tasks by category"""
+    # Group task positions by category once. Category codes follow first
+    # appearance, so categories keep that order
+    category_groups: Dict[int, List[int]] = defaultdict(list)
+    for i, code in enumerate(task_arrays.category_codes.tolist()):
+        category_groups[code].append(i)
+    
+    # Distribute categories across slots - one category per slot for simplicity.
+    # Each slot gets the first category with tasks left
+    def next_batch(day_index: int, assigned: Set[int]) -> List[int]:
+        for group in category_groups.values():
+            pending = [i for i in group if i not in assigned]
+            if pending:
+                return pending
+        return []
+    
+    return _pack("Category-Focused Schedule", task_arrays, slots_by_day, constraints,
+                 start_date, end_date, next_batch)
+
+def _generate_balanced_schedule(task_arrays: _TaskArrays, slots_by_day: SlotsByDay,
+                                constraints: TimeConstraints, start_date: datetime,
+                                end_date: datetime) -> Tuple[Optional[Schedule], bool]:
+    """Generate a schedule balancing tasks evenly across days"""
+    durations = task_arrays.durations
+    duration_list = task_arrays.duration_list
     days = (end_date - start_date).days + 1
-    daily_budget = total_task_minutes / days
     
     # Distribute tasks evenly across days
-    assigned_tasks = []
-    daily_tasks = {i: [] for i in range(days)}
-    daily_minutes = {i: 0 for i in range(days)}
+    daily_tasks = {d: [] for d in range(days)}
+    
+    # Min-heap of (minutes assigned, day index); ties go to the earlier day
+    day_loads = [(0, d) for d in range(days)]
+    heapq.heapify(day_loads)
     
     # Sort tasks by duration (longest first for better bin packing)
-    sorted_tasks = sorted(tasks, key=lambda t: t.duration, reverse=True)
+    sorted_tasks = np.argsort(-durations, kind="stable").tolist()
     
-    # Simple greedy algorithm to distribute tasks
-    for task in sorted_tasks:
+    # Simple greedy algorithm to distribute tasks (LPT scheduling)
+    for i in sorted_tasks:
         # Find the day with the most remaining budget
-        best_day = min(range(days), key=lambda d: daily_minutes[d])
+        load, best_day = heapq.heappop(day_loads)
         
         # Add task to that day
-        daily_tasks[best_day].append(task)
-        daily_minutes[best_day] += task.duration
-    
-    # Now schedule tasks within each day
-    current_date = start_date
-    for day_idx in range(days):
-        day_tasks = daily_tasks[day_idx]
-        day = datetime_to_day_of_week(current_date)
-        slots = constraints.get_available_slots_for_day(day)
-        
-        for slot in slots:
-            slot_start = datetime.combine(current_date.date(), slot.start_time)
-            slot_end = datetime.combine(current_date.date(), slot.end_time)
-            
-            # Handle slots that go past midnight
-            if slot.end_time <= slot.start_time:
-                slot_end += timedelta(days=1)
-            
-            # Try to fit tasks into this slot
-            current_time = slot_start
-            remaining_tasks = [t for t in day_tasks if t not in assigned_tasks]
-            
-            while current_time < slot_end and remaining_tasks:
-                # Get next task
-                task = remaining_tasks[0]
-                
-                # Check if task fits in remaining time
-                task_end = current_time + timedelta(minutes=task.duration)
-                if task_end <= slot_end:
-                    assigned_tasks.append(task)
-                    schedule.tasks.append(task)
-                    # In reality we'd store the start time in the join table, but for simplicity
-                    # we'll just construct a ScheduleTaskInfo
-                    task_info = ScheduleTaskInfo(task_id=task.id, start_time=current_time)
-                    
-                    # Increment time
-                    current_time = task_end
-                
-                # Move to next task
-                remaining_tasks = remaining_tasks[1:]
-        
-        current_date += timedelta(days=1)
+        daily_tasks[best_day].append(i)
+        heapq.heappush(day_loads, (load + duration_list[i], best_day))
     
-    # If we couldn't schedule any tasks, return None
-    if not schedule.tasks:
-        return None
-        
-    return schedule
+    # Each day's slots are only offered the tasks distributed to that day
+    def next_batch(day_index: int, assigned: Set[int]) -> List[int]:
+        return [i for i in daily_tasks[day_index] if i not in assigned]
+    
+    return _pack("Balanced Schedule", task_arrays, slots_by_day, constraints,
+                 start_date, end_date, next_batch)
 
-def _generate_random_schedule(tasks: List[Task], constraints: TimeConstraints) -> Optional[Schedule]:
+def _generate_random_schedule(task_arrays: _TaskArrays, slots_by_day: SlotsByDay,
+                              constraints: TimeConstraints, start_date: datetime,
+                              end_date: datetime) -> Tuple[Optional[Schedule], bool]:
     """Generate a random but valid schedule"""
-    start_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    end_date = start_date + timedelta(days=6)  # One week schedule
+    # Shuffle tasks randomly
+    shuffled_tasks = list(range(len(task_arrays.tasks)))
+    random.shuffle(shuffled_tasks)
     
-    schedule = Schedule(
-        id=uuid.uuid4(),
-        name="Random Schedule",
-        start_date=start_date,
-        end_date=end_date,
-        objective_scores={},
-        pareto_rank=0,
-        is_dominated=False,
-    )
+    def next_batch(day_index: int, assigned: Set[int]) -> List[int]:
+        return [i for i in shuffled_tasks if i not in assigned]
     
-    # Shuffle tasks randomly
-    shuffled_tasks = random.sample(tasks, len(tasks))
+    # Pick a random slot of each day
+    def pick_slots(slots: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        return [random.choice(slots)] if slots else []
+    
+    return _pack("Random Schedule", task_arrays, slots_by_day, constraints,
+                 start_date, end_date, next_batch, pick_slots)
+
+_ONE_MINUTE = timedelta(minutes=1)
+
+def _slot_arrays(constraints: TimeConstraints) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the available slots as start/end minute and weekday arrays"""
+    slots = constraints.available_slots
     
-    # Assign time slots randomly
-    assigned_tasks = []
+    slot_starts = np.array([_time_to_minutes(s.start_time) for s in slots], dtype=np.int32)
+    slot_ends = np.array([_time_to_minutes(s.end_time) for s in slots], dtype=np.int32)
+    slot_weekdays = np.array([_DOW_TO_WEEKDAY[s.day] for s in slots], dtype=np.int32)
     
-    current_date = start_date
-    while current_date <= end_date and len(assigned_tasks) < len(tasks):
-        day = datetime_to_day_of_week(current_date)
-        slots = constraints.get_available_slots_for_day(day)
-        
-        if not slots:
-            current_date += timedelta(days=1)
-            continue
-        
-        # Pick a random slot
-        slot = random.choice(slots)
-        
-        slot_start = datetime.combine(current_date.date(), slot.start_time)
-        slot_end = datetime.combine(current_date.date(), slot.end_time)
-        
-        # Handle slots that go past midnight
-        if slot.end_time <= slot.start_time:
-            slot_end += timedelta(days=1)
-        
-        remaining_tasks = [t for t in shuffled_tasks if t not in assigned_tasks]
-        if not remaining_tasks:
-            break
-            
-        # Try to fit tasks into this slot
-        current_time = slot_start
-        
-        while current_time < slot_end and remaining_tasks:
-            # Get next task
-            task = remaining_tasks[0]
-            
-            # Check if task fits in remaining time
-            task_end = current_time + timedelta(minutes=task.duration)
-            if task_end <= slot_end:
-                assigned_tasks.append(task)
-                schedule.tasks.append(task)
-                # In reality we'd store the start time in the join table, but for simplicity
-                # we'll just construct a ScheduleTaskInfo
-                task_info = ScheduleTaskInfo(task_id=task.id, start_time=current_time)
-                
-                # Increment time
-                current_time = task_end
-            
-            # Move to next task
-            remaining_tasks = remaining_tasks[1:]
-        
-        current_date += timedelta(days=1)
+    # Slots that go past midnight end on the next day
+    slot_ends[slot_ends <= slot_starts] += MINUTES_PER_DAY
     
-    # If we couldn't schedule any tasks, return None
-    if not schedule.tasks:
-        return None
-        
-    return schedule
+    return slot_starts, slot_ends, slot_weekdays
 
 def is_schedule_feasible(schedule: Schedule, constraints: TimeConstraints) -> bool:
     """
@@ -395,97 +492,36 @@ def is_schedule_feasible(schedule: Schedule, constraints: TimeConstraints) -> bo
         True if the schedule is feasible, False otherwise
     
     """
-    # Check 1: Are all tasks assigned valid time slots?
-    for task in schedule.tasks:
-        # Get task start time from the join table (here simplified)
-        # In reality, we'd look up the start_time from the schedule_tasks table
-        start_time = datetime.now()  # Placeholder
-        
-        # Calculate end time
-        end_time = start_time + timedelta(minutes=task.duration)
-        
-        # Check if task occurs during an available time slot
-        task_day = datetime_to_day_of_week(start_time)
-        available_slots = constraints.get_available_slots_for_day(task_day)
-        
-        slot_valid = False
-        for slot in available_slots:
-            slot_start = datetime.combine(start_time.date(), slot.start_time)
-            slot_end = datetime.combine(start_time.date(), slot.end_time)
-
-            # Check if task fits in slot
-            if start_time >= slot_start and end_time <= slot_end:
-                slot_valid = True
-                break
-        
-        if not slot_valid:
-            return False
-    
-    # Check 2: Daily and weekly time limits
-    daily_minutes = {}
-    weekly_total = 0
-    
-    for task in schedule.tasks:
-        start_time = datetime.now()  # Placeholder
-        day_key = start_time.date()
-        
-        if day_key not in daily_minutes:
-            daily_minutes[day_key] = 0
-            
-        daily_minutes[day_key] += task.duration
-        weekly_total += task.duration
-        
-        # Check daily limit
-        if daily_minutes[day_key] > constraints.max_daily_work_minutes:
-            return False
+    tasks = schedule.tasks
+    if not tasks:
+        return True
     
-    # Check weekly limit
-    if weekly_total > constraints.max_weekly_work_minutes:
+    # Get task start times from the join table (here simplified)
+    # In reality, we'd look up the start_time from the schedule_tasks table
+    start_times = [datetime.now() for _ in tasks]  # Placeholder
+    
+    # Convert everything to whole minutes since midnight of the first day so
+    # the numeric checks can run in a compiled kernel
+    origin = min(start_times).replace(hour=0, minute=0, second=0, microsecond=0)
+    starts = np.array([(t - origin) // _ONE_MINUTE for t in start_times], dtype=np.int32)
+    durations = np.array([task.duration for task in tasks], dtype=np.int32)
+    slot_starts, slot_ends, slot_weekdays = _slot_arrays(constraints)
+    
+    # Dependencies as (task, dependency) position pairs; -1 marks a
+    # dependency that isn't part of the schedule
+    positions = {task.id: i for i, task in enumerate(tasks)}
+    dep_pairs = [(i, positions.get(dep.id, -1)) for i, task in enumerate(tasks) for dep in task.dependencies]
+    dep_tasks = np.array([i for i, _ in dep_pairs], dtype=np.int32)
+    dep_positions = np.array([dep for _, dep in dep_pairs], dtype=np.int32)
+    
+    # Checks 1 to 4: slots, daily/weekly limits, dependencies and overlaps
+    if not feasibility_kernel(starts, durations, slot_starts, slot_ends, slot_weekdays,
+                              origin.weekday(),
+                              constraints.max_daily_work_minutes,
+                              constraints.max_weekly_work_minutes,
+                              dep_tasks, dep_positions):
         return False
     
-    # Check 3: Task dependencies
-    task_start_times = {}
-    task_end_times = {}
-    
-    for task in schedule.tasks:
-        start_time = datetime.now()  # Placeholder
-        end_time = start_time + timedelta(minutes=task.duration)
-        
-        task_start_times[task.id] = start_time
-        task_end_times[task.id] = end_time
-    
-    for task in schedule.tasks:
-        # Check each dependency - must finish before this task starts
-        for dep in task.dependencies:
-            if dep.id not in task_end_times:
-                # Dependency not scheduled
-                return False
-                
-            if task_start_times[task.id] < task_end_times[dep.id]:
-                # Dependency not completed before task starts
-                return False
-    
-    # Check 4: No task overlaps (for the same resource)
-    # For simplicity, we'll assume each task can only be worked on by one person
-    task_time_ranges = []
-    
-    for task in schedule.tasks:
-        start_time = datetime.now()  # Placeholder
-        end_time = start_time + timedelta(minutes=task.duration)
-        
-        # Check for overlaps with existing tasks
-        for other_start, other_end in task_time_ranges:
-            # Overlapping if:
-            # - This task starts during another task
-            # - This task ends during another task
-            # - This task completely contains another task
-            if (start_time < other_end and start_time >= other_start) or \
-               (end_time <= other_end and end_time > other_start) or \
-               (start_time <= other_start and end_time >= other_end):
-                return False
-        
-        task_time_ranges.append((start_time, end_time))
-    
     # Check 5: Resource constraints
     # For simplicity, we'll skip this implementation
     # but in a real system, we'd check things like:
@@ -496,10 +532,15 @@ def is_schedule_feasible(schedule: Schedule, constraints: TimeConstraints) -> bo
     # If all checks pass, the schedule is feasible
     return True
 
+# Below this many slots check_time_slot_overlap stays in plain Python
+_VECTORIZE_MIN_SLOTS = 32
+
 def check_time_slot_overlap(time_slots: list) -> bool:
     """
     Determines if any time slots in the given list overlap with each other.
-    Each time slot is a tuple of (start_time, end_time) in minutes since midnight.
+    Each time slot is a tuple of integer (start_time, end_time), such as minutes
+    since midnight or epoch milliseconds; an (N, 2) integer array of the same
+    values works too.
     
     For example:
     [(30, 90), (120, 180)] => False (no overlaps)
@@ -511,17 +552,27 @@ def check_time_slot_overlap(time_slots: list) -> bool:
     if len(time_slots) <= 1:
         return False
     
-    # Sort slots by start time
-    sorted_slots = sorted(time_slots, key=lambda x: x[0])
-    
-    for i in range(len(sorted_slots) - 1):
-        current_end = sorted_slots[i][1]
-        next_start = sorted_slots[i + 1][0]
+    # For a handful of slots building arrays costs more than the sweep itself
+    if len(time_slots) < _VECTORIZE_MIN_SLOTS and not isinstance(time_slots, np.ndarray):
+        sorted_slots = sorted(time_slots, key=itemgetter(0))
+        
+        # Compare each start with the latest end seen so far
+        max_end = sorted_slots[0][1]
+        for start, end in sorted_slots[1:]:
+            if start < max_end:
+                return True
+            max_end = max(max_end, end)
         
-        if current_end > next_start:
-            return True
+        return False
     
-    return False
+    # Lay the slots out as an (N, 2) array once; 64 bits, so epoch values fit
+    slots = np.asarray(time_slots, dtype=np.int64).reshape(-1, 2)
+    
+    # Sort slots by start time; if any two slots overlap, then some slot also
+    # overlaps its direct predecessor, so one vectorized pass suffices
+    ordered = slots[np.argsort(slots[:, 0], kind="stable")]
+    
+    return bool(np.any(ordered[:-1, 1] > ordered[1:, 0]))
 
 def calculate_objective_scores(
     schedule: Schedule,
@@ -543,12 +594,15 @@ def calculate_objective_scores(
     
     scores = {}
     
+    # Walk the tasks once; each objective then looks up its category
+    category_hours = _category_hours(schedule)
+    
     for objective in objectives:
         # Calculate raw score based on objective category and time frame
-        raw_score = _calculate_raw_score(schedule, objective)
+        raw_score = category_hours.get(objective.category, 0.0)
         
-        # Normalize to 0-1 scale (higher is better)
-        normalized_score = min(1.0, max(0.0, raw_score / objective.target_value))
+        # Normalize to 0-1 scale (higher is better); a zero target counts as 1
+        normalized_score = min(1.0, max(0.0, raw_score / (objective.target_value or 1.0)))
         
         scores[objective.id] = normalized_score
     
@@ -646,19 +700,15 @@ def is_schedule_valid(tasks: List[Task], task_start_times: Dict[str, int],
             
     return True
 
-def _calculate_raw_score(schedule: Schedule, objective: Objective) -> float:
-    """Calculate the raw score for an objective based on tasks in the schedule"""
+def _category_hours(schedule: Schedule) -> Dict[TaskCategory, float]:
+    """Sum the hours of the tasks in the schedule per category"""
     # This is a simplified implementation - in reality we would have more
     # complex logic for different objective types
     
-    # Sum up metrics based on objective category
-    total = 0.0
+    # Simple scoring: each task contributes proportionally to its duration
+    totals = defaultdict(float)
     
     for task in schedule.tasks:
-        if task.category == objective.category:
-            # Evaluate based on task properties
-            if task.category == objective.category:
-                # Simple scoring: task contributes proportionally to its duration
-                total += task.duration / 60.0  # Convert to hours
+        totals[task.category] += task.duration / 60.0  # Convert to hours
     
-    return total
\ No newline at end of file
+    return totals
\ No newline at end of file
@@ -2,26 +2,54 @@ from typing import List, Dict, Set, Tuple, Optional
 from datetime import datetime, timedelta
 import uuid
 import math
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+from ._scoring_kernels import normalize_columns
 from ..models.task import Task, TaskCategory
 from ..models.objective import Objective, TimeFrame
 from ..models.schedule import Schedule
 
-def calculate_objective_scores(schedule: Schedule, objectives: List[Objective]) -> Dict[str, float]:
+# Days in each time frame; months and years are approximate
+_TIME_FRAME_DAYS = {
+    TimeFrame.DAILY: 1,
+    TimeFrame.WEEKLY: 7,
+    TimeFrame.MONTHLY: 30,
+    TimeFrame.YEARLY: 365,
+}
+
+def calculate_objective_scores(schedule: Schedule, objectives: List[Objective],
+                               normalize: bool = True) -> Dict[str, float]:
     """
     Calculate how well a schedule satisfies each objective.
     
     Args:
         schedule: The schedule to evaluate
         objectives: List of objectives to score against
+        normalize: Whether to scale scores against each objective's target
+            (0-1 scale); callers that normalize across schedules themselves
+            can skip it and get the raw scores
         
     Returns:
         Dictionary mapping objective IDs to scores
     """
     scores = {}
     
+    # Walk the tasks once; every objective reads its category's total
+    totals = _duration_by_category(schedule)
+    
     for objective in objectives:
+        # Objectives whose category has no tasks in the schedule score zero
+        if objective.category not in totals:
+            scores[str(objective.id)] = 0.0
+            continue
+        
         # Calculate raw score for this objective
-        raw_score = score_schedule_for_objective(schedule, objective)
+        raw_score = score_schedule_for_objective(schedule, objective, totals)
+        
+        if not normalize:
+            scores[str(objective.id)] = raw_score
+            continue
         
         # Normalize to 0-1 scale (higher is better)
         normalized_score = min(1.0, max(0.0, raw_score / (objective.target_value or 1.0)))
@@ -31,80 +59,51 @@ def calculate_objective_scores(schedule: Schedule, objectives: List[Objective])
     
     return scores
 
-def score_schedule_for_objective(schedule: Schedule, objective: Objective) -> float:
+def _duration_by_category(schedule: Schedule) -> Dict[TaskCategory, int]:
+    """Total the task minutes of a schedule per category"""
+    totals = defaultdict(int)
+    
+    for task in schedule.tasks:
+        totals[task.category] += task.duration
+    
+    return totals
+
+def score_schedule_for_objective(schedule: Schedule, objective: Objective,
+                                 totals: Optional[Dict[TaskCategory, int]] = None) -> float:
     """
     Calculate a raw score for how well a schedule satisfies an objective.
     
     Args:
         schedule: The schedule to evaluate
         objective: The objective to score against
+        totals: Task minutes per category, as returned by _duration_by_category;
+            computed from the schedule if not given
         
     Returns:
         Raw score value (higher is better)
     """
-    # Filter tasks by category
-    relevant_tasks = [task for task in schedule.tasks if task.category == objective.category]
+    if totals is None:
+        totals = _duration_by_category(schedule)
+    
+    total_minutes = totals.get(objective.category, 0)
     
     # No relevant tasks means zero score
-    if not relevant_tasks:
+    if not total_minutes:
         return 0.0
     
-    # Calculate base score depending on time frame
-    if objective.time_frame == TimeFrame.DAILY:
-        return _calculate_daily_score(schedule, relevant_tasks, objective)
-    elif objective.time_frame == TimeFrame.WEEKLY:
-        return _calculate_weekly_score(schedule, relevant_tasks, objective)
-    elif objective.time_frame == TimeFrame.MONTHLY:
-        return _calculate_monthly_score(schedule, relevant_tasks, objective)
-    elif objective.time_frame == TimeFrame.YEARLY:
-        return _calculate_yearly_score(schedule, relevant_tasks, objective)
-    
-    # Default fallback
-    return sum(task.duration for task in relevant_tasks) / 60.0  # hours
+    # Average hours per day, week, month or year of the schedule
+    return total_minutes / 60.0 / _period_length(schedule, objective.time_frame)
 
-def _calculate_daily_score(schedule: Schedule, tasks: List[Task], objective: Objective) -> float:
-    """Calculate score for a daily objective"""
-    # Get schedule duration in days
-    days = (schedule.end_date - schedule.start_date).days + 1
+def _period_length(schedule: Schedule, time_frame: TimeFrame) -> int:
+    """Get the schedule length in whole periods of the time frame (partial periods count as one)"""
+    period_days = _TIME_FRAME_DAYS.get(time_frame)
     
-    # Calculate average daily value
-    total_value = sum(task.duration for task in tasks) / 60.0  # hours
-    daily_average = total_value / days
+    # Default fallback: plain hours
+    if period_days is None:
+        return 1
     
-    return daily_average
-
-def _calculate_weekly_score(schedule: Schedule, tasks: List[Task], objective: Objective) -> float:
-    """Calculate score for a weekly objective"""
-    # Get schedule duration in weeks (partial weeks count)
-    weeks = ((schedule.end_date - schedule.start_date).days + 1) / 7.0
-    
-    # Calculate average weekly value
-    total_value = sum(task.duration for task in tasks) / 60.0  # hours
-    weekly_average = total_value / max(1.0, weeks)  # avoid division by zero
-    
-    return weekly_average
-
-def _calculate_monthly_score(schedule: Schedule, tasks: List[Task], objective: Objective) -> float:
-    """Calculate score for a monthly objective"""
-    # Get schedule duration in months (approximate)
-    months = ((schedule.end_date - schedule.start_date).days + 1) / 30.0
-    
-    # Calculate average monthly value
-    total_value = sum(task.duration for task in tasks) / 60.0  # hours
-    monthly_average = total_value / max(1.0, months)  # avoid division by zero
-    
-    return monthly_average
-
-def _calculate_yearly_score(schedule: Schedule, tasks: List[Task], objective: Objective) -> float:
-    """Calculate score for a yearly objective"""
-    # Get schedule duration in years (approximate)
-    years = ((schedule.end_date - schedule.start_date).days + 1) / 365.0
-    
-    # Calculate average yearly value
-    total_value = sum(task.duration for task in tasks) / 60.0  # hours
-    yearly_average = total_value / max(1.0, years)  # avoid division by zero
-    
-    return yearly_average
+    days = schedule.duration_days
+    return max(1, -(-days // period_days))  # ceiling division, at least one period
 
 def calculate_objective_weights(objectives: List[Objective]) -> Dict[uuid.UUID, float]:
     """
@@ -119,8 +118,15 @@ def calculate_objective_weights(objectives: List[Objective]) -> Dict[uuid.UUID,
     if not objectives:
         return {}
     
+    # Weights rarely change between calls, so the result is memoized on the
+    # (id, weight) pairs; callers get their own copy of it
+    return dict(_normalize_weights(tuple((obj.id, obj.weight) for obj in objectives)))
+
+@lru_cache(maxsize=128)
+def _normalize_weights(weights: Tuple[Tuple[uuid.UUID, float], ...]) -> Tuple[Tuple[uuid.UUID, float], ...]:
+    """Normalize (id, weight) pairs to sum to 1.0, see calculate_objective_weights"""
     # Extract raw weights
-    raw_weights = {obj.id: obj.weight for obj in objectives}
+    raw_weights = dict(weights)
     
     # Calculate sum of all weights
     total_weight = sum(raw_weights.values())
@@ -128,13 +134,10 @@ def calculate_objective_weights(objectives: List[Objective]) -> Dict[uuid.UUID,
     # Normalize weights
     if total_weight == 0:
         # If all weights are zero, distribute evenly
-        normalized_weights = {obj_id: 1.0 / len(objectives) for obj_id in raw_weights}
-    else:
-        # Otherwise normalize to sum to 1.0
-        normalized_weights = {obj_id: raw_weight / total_weight 
-                             for obj_id, raw_weight in raw_weights.items()}
+        return tuple((obj_id, 1.0 / len(weights)) for obj_id in raw_weights)
     
-    return normalized_weights
+    # Otherwise normalize to sum to 1.0
+    return tuple((obj_id, raw_weight / total_weight) for obj_id, raw_weight in raw_weights.items())
 
 def calculate_weighted_score(scores: Dict[uuid.UUID, float], 
                            weights: Dict[uuid.UUID, float]) -> float:
@@ -157,6 +160,127 @@ def calculate_weighted_score(scores: Dict[uuid.UUID, float],
     
     return weighted_sum
 
+def calculate_weighted_scores(scores: Dict[uuid.UUID, Dict[uuid.UUID, float]],
+                              weights: Dict[uuid.UUID, float]) -> Dict[uuid.UUID, float]:
+    """
+    Calculate the weighted sum score of many schedules at once.
+    
+    Same result as calling calculate_weighted_score per schedule, but the
+    scores are stacked into one (schedules, objectives) matrix and weighted
+    with a single matrix-vector product.
+    
+    Args:
+        scores: Dictionary mapping schedule IDs to objective scores, as
+            returned by score_schedules
+        weights: Dictionary mapping objective IDs to weights
+        
+    Returns:
+        Dictionary mapping schedule IDs to weighted sum scores
+    """
+    if not scores:
+        return {}
+    
+    obj_ids = list(weights)
+    weight_vec = np.fromiter(weights.values(), dtype=np.float64, count=len(obj_ids))
+    
+    # Objectives a schedule has no score for contribute nothing
+    score_matrix = np.array([[schedule_scores.get(obj_id, 0.0) for obj_id in obj_ids]
+                             for schedule_scores in scores.values()], dtype=np.float64)
+    score_matrix = score_matrix.reshape(len(scores), len(obj_ids))
+    
+    return dict(zip(scores, (score_matrix @ weight_vec).tolist()))
+
+# Column of each category in the per-schedule duration matrix
+_CATEGORY_INDEX = {category: k for k, category in enumerate(TaskCategory)}
+
+def _periods(days: np.ndarray, time_frame: TimeFrame) -> np.ndarray:
+    """Schedule lengths in whole periods of the time frame, vectorized _period_length"""
+    period_days = _TIME_FRAME_DAYS.get(time_frame)
+    
+    # Default fallback: plain hours
+    if period_days is None:
+        return np.ones_like(days)
+    
+    return np.maximum(1, -(-days // period_days))
+
+def _raw_score_matrix(schedules: List[Schedule], objectives: List[Objective]) -> np.ndarray:
+    """
+    Calculate the raw scores of every schedule for every objective at once.
+    
+    The tasks of all schedules are walked once into flat arrays and summed
+    per schedule and category with np.bincount; every objective then reads
+    its category's column.
+    
+    Args:
+        schedules: Schedules to evaluate
+        objectives: Objectives to score against
+        
+    Returns:
+        (S, O) float matrix where [i, j] is the raw score of schedule i for
+        objective j, the same value score_schedule_for_objective returns
+    """
+    n_categories = len(_CATEGORY_INDEX)
+    
+    # Flatten every task into parallel arrays: its (schedule, category) cell
+    # of the duration matrix and its minutes
+    cells = []
+    durations = []
+    days = np.empty(len(schedules), dtype=np.int64)
+    
+    for i, schedule in enumerate(schedules):
+        base = i * n_categories
+        for task in schedule.tasks:
+            cells.append(base + _CATEGORY_INDEX[task.category])
+            durations.append(task.duration)
+        days[i] = schedule.duration_days
+    
+    # Sum the minutes of each cell in one pass
+    minutes = np.bincount(np.array(cells, dtype=np.intp),
+                          weights=np.array(durations, dtype=np.float64),
+                          minlength=len(schedules) * n_categories)
+    minutes = minutes.reshape(len(schedules), n_categories)
+    
+    raw = np.empty((len(schedules), len(objectives)), dtype=np.float64)
+    
+    for j, objective in enumerate(objectives):
+        hours = minutes[:, _CATEGORY_INDEX[objective.category]] / 60.0
+        raw[:, j] = hours / _periods(days, objective.time_frame)
+    
+    return raw
+
+def score_schedules_matrix(schedules: List[Schedule],
+                           objectives: List[Objective],
+                           normalize: bool = True) -> Tuple[np.ndarray, List[uuid.UUID], List[uuid.UUID]]:
+    """
+    Calculate scores for multiple schedules against multiple objectives as a matrix.
+    
+    Args:
+        schedules: List of schedules to evaluate
+        objectives: List of objectives to score against
+        normalize: Whether to normalize scores across schedules (0-1 scale)
+        
+    Returns:
+        (S, O) float64 score matrix, the schedule IDs of its rows and the
+        objective IDs of its columns
+    """
+    schedule_ids = [schedule.id for schedule in schedules]
+    obj_ids = [objective.id for objective in objectives]
+    
+    if not schedules:
+        return np.empty((0, len(objectives)), dtype=np.float64), schedule_ids, obj_ids
+    
+    # Calculate raw scores
+    scores = _raw_score_matrix(schedules, objectives)
+    
+    # Normalize scores if requested
+    if normalize:
+        # Min-max scale each objective's column to the 0-1 range. Where every
+        # schedule scored the same there's nothing to scale; any positive
+        # score counts as fully met instead
+        scores = normalize_columns(scores)
+    
+    return scores, schedule_ids, obj_ids
+
 def score_schedules(schedules: List[Schedule], 
                   objectives: List[Objective],
                   normalize: bool = True) -> Dict[uuid.UUID, Dict[uuid.UUID, float]]:
@@ -171,47 +295,7 @@ def score_schedules(schedules: List[Schedule],
     Returns:
         Dictionary mapping schedule IDs to dictionaries mapping objective IDs to scores
     """
-    # Calculate raw scores
-    scores = {}
+    scores, schedule_ids, obj_ids = score_schedules_matrix(schedules, objectives, normalize)
     
-    for schedule in schedules:
-        schedule_scores = {}
-        
-        for objective in objectives:
-            raw_score = score_schedule_for_objective(schedule, objective)
-            schedule_scores[objective.id] = raw_score
-        
-        scores[schedule.id] = schedule_scores
-    
-    # Normalize scores if requested
-    if normalize and schedules:
-        # Find min/max for each objective
-        min_scores = {}
-        max_scores = {}
-        
-        for objective in objectives:
-            obj_scores = [scores[schedule.id][objective.id] for schedule in schedules]
-            
-            if obj_scores:
-                min_scores[objective.id] = min(obj_scores)
-                max_scores[objective.id] = max(obj_scores)
-            else:
-                min_scores[objective.id] = 0.0
-                max_scores[objective.id] = 1.0
-        
-        # Normalize scores
-        for schedule in schedules:
-            for objective in objectives:
-                obj_id = objective.id
-                raw_score = scores[schedule.id][obj_id]
-                
-                # Avoid division by zero
-                if max_scores[obj_id] == min_scores[obj_id]:
-                    normalized = 1.0 if raw_score > 0 else 0.0
-                else:
-                    # Scale to 0-1 range
-                    normalized = (raw_score - min_scores[obj_id]) / (max_scores[obj_id] - min_scores[obj_id])
-                
-                scores[schedule.id][obj_id] = normalized
-    
-    return scores
\ No newline at end of file
+    return {schedule_id: dict(zip(obj_ids, row))
+            for schedule_id, row in zip(schedule_ids, scores.tolist())}
@@ -1,19 +1,60 @@
+import os
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./pareto_planner.db"
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./pareto_planner.db")
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# Connection pool sizing for server databases, overridable per deployment
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+
+if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+    # SQLite connections are local file handles; SQLAlchemy's default pool
+    # for them already reuses connections across requests
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    )
+else:
+    # Keep enough connections open for the threadpool under load, check them
+    # before use and replace them before the server times them out
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE
+    )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Columns added to existing tables after they were first created, with their
+# DDL type and index. create_all only creates missing tables, so databases
+# from before these columns existed get them from add_missing_columns
+_ADDED_COLUMNS = {
+    "schedules": [("dominator_id", "VARCHAR", "ix_schedules_dominator_id")],
+}
+
+def add_missing_columns(bind) -> None:
+    """Add the columns listed in _ADDED_COLUMNS to tables that lack them"""
+    inspector = inspect(bind)
+    
+    with bind.begin() as conn:
+        for table, columns in _ADDED_COLUMNS.items():
+            if not inspector.has_table(table):
+                continue
+            
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, ddl_type, index_name in columns:
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"))
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({name})"))
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
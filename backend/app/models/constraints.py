@@ -1,7 +1,9 @@
-from datetime import time, datetime, timedelta
-from typing import List, Dict, Optional, Any, Union
-from pydantic import BaseModel, Field, validator
+from datetime import date, time, datetime, timedelta
+from typing import List, Dict, Optional, Any, Union, FrozenSet
+from pydantic import BaseModel, Field, field_validator, ValidationInfo
 from enum import Enum
+from functools import cached_property
+from operator import attrgetter
 
 # I don't like how verbose this is, but it works...
 class DayOfWeek(str, Enum):
@@ -19,9 +21,10 @@ class TimeSlot(BaseModel):
     start_time: time
     end_time: time
     
-    @validator('end_time')
-    def end_time_after_start_time(cls, v, values):
-        if 'start_time' in values and v <= values['start_time']:
+    @field_validator('end_time')
+    @classmethod
+    def end_time_after_start_time(cls, v, info: ValidationInfo):
+        if 'start_time' in info.data and v <= info.data['start_time']:
             # Special case for slots that go past midnight
             if v == time(0, 0, 0):  # midnight
                 return v
@@ -34,7 +37,8 @@ class ResourceConstraint(BaseModel):
     max_daily_usage: int  # Max usage per day
     max_weekly_usage: Optional[int] = None  # Optional weekly limit
     
-    @validator('max_daily_usage', 'max_weekly_usage')
+    @field_validator('max_daily_usage', 'max_weekly_usage')
+    @classmethod
     def validate_positive(cls, v):
         if v is not None and v <= 0:
             raise ValueError('Resource constraints must be positive')
@@ -50,33 +54,45 @@ class TimeConstraints(BaseModel):
     # Add any specific date exclusions (holidays, vacations, etc)
     excluded_dates: List[datetime] = Field(default_factory=list)
     
-    @validator('max_daily_work_minutes', 'max_weekly_work_minutes')
+    @field_validator('max_daily_work_minutes', 'max_weekly_work_minutes')
+    @classmethod
     def validate_work_minutes(cls, v):
         if v <= 0:
             raise ValueError('Work minute constraints must be positive')
         return v
     
+    @cached_property
+    def excluded_date_set(self) -> FrozenSet[date]:
+        """Calendar dates of the excluded dates, built on first use"""
+        return frozenset(ex_date.date() for ex_date in self.excluded_dates)
+    
     def is_date_available(self, date: datetime) -> bool:
         """Check if a specific date is available (not excluded)"""
-        return date.date() not in [ex_date.date() for ex_date in self.excluded_dates]
+        return date.date() not in self.excluded_date_set
+    
+    @cached_property
+    def slots_by_day(self) -> Dict[DayOfWeek, List[TimeSlot]]:
+        """Available slots grouped by day of week and sorted by start time, built on first use"""
+        index = {day: [] for day in DayOfWeek}
+        for slot in sorted(self.available_slots, key=attrgetter('start_time')):
+            index[slot.day].append(slot)
+        return index
     
     def get_available_slots_for_day(self, day: DayOfWeek) -> List[TimeSlot]:
-        """Get all available time slots for a specific day of week"""
-        return [slot for slot in self.available_slots if slot.day == day]
+        """Get all available time slots for a specific day of week, earliest first"""
+        return self.slots_by_day[day]
     
     def get_total_available_minutes(self) -> int:
         """Calculate total available minutes across all slots"""
         total = 0
         for slot in self.available_slots:
-            # Calculate duration accounting for potential midnight crossover
             start_minutes = slot.start_time.hour * 60 + slot.start_time.minute
             end_minutes = slot.end_time.hour * 60 + slot.end_time.minute
             
-            # Handle slots that cross midnight
-            if end_minutes <= start_minutes and slot.end_time != time(0, 0):
-                duration = (24 * 60 - start_minutes) + end_minutes
-            else:
-                duration = end_minutes - start_minutes
-                
-            total += duration
-        return total
\ No newline at end of file
+            # Slots that end at or before their start run past midnight
+            # (the validator only allows this for slots ending at 00:00)
+            if end_minutes <= start_minutes:
+                end_minutes += 24 * 60
+            
+            total += end_minutes - start_minutes
+        return total
@@ -2,7 +2,7 @@ import enum
 import uuid
 from sqlalchemy import Column, String, Float, Enum
 from typing import Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 from .base import Base
 from .task import TaskCategory
@@ -40,7 +40,8 @@ class ObjectiveBase(BaseModel):
     time_frame: TimeFrame
     
     # Ensure weight is valid
-    @validator('weight')
+    @field_validator('weight')
+    @classmethod
     def weight_must_be_valid(cls, v):
         if not 0 <= v <= 1:
             raise ValueError('Weight must be between 0 and 1')
@@ -59,7 +60,8 @@ class ObjectiveUpdate(BaseModel):
     measurement_unit: Optional[str] = None
     time_frame: Optional[TimeFrame] = None
     
-    @validator('weight')
+    @field_validator('weight')
+    @classmethod
     def validate_weight(cls, v):
         if v is not None and not (0 <= v <= 1):
             raise ValueError('Weight must be between 0 and 1')
@@ -1,9 +1,10 @@
 import uuid
 from sqlalchemy import Column, String, DateTime, Integer, Boolean, ForeignKey, Table, JSON
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.mutable import MutableDict
 from datetime import datetime
 from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator, ValidationInfo
 
 from .base import Base
 
@@ -17,6 +18,18 @@ schedule_tasks = Table(
     Column('start_time', DateTime, nullable=False)
 )
 
+class _ScoreDict(MutableDict):
+    """Objective scores that drop a schedule's cached score entry when edited in place"""
+    
+    def changed(self) -> None:
+        # core.pareto caches the scores as an array on the schedule, keyed on
+        # the identity of this dict; an in-place edit keeps the identity
+        for parent in self._parents:
+            schedule = parent.obj()
+            if schedule is not None:
+                schedule.__dict__.pop("_scores_arr", None)
+        super().changed()
+
 class Schedule(Base):
     """Schedule model representing a proposed arrangement of tasks."""
     __tablename__ = "schedules"
@@ -28,17 +41,20 @@ class Schedule(Base):
     
     # Store scores as JSON - not ideal but works for now
     # Format: {"objective_id": score_float, ...}
-    objective_scores = Column(JSON, default={})
+    objective_scores = Column(_ScoreDict.as_mutable(JSON), default={})
     
     # Pareto optimization data
     pareto_rank = Column(Integer, default=0)
     is_dominated = Column(Boolean, default=False)
+    # A schedule known to dominate this one (any front member will do); lets
+    # the front be maintained incrementally instead of recomputed on every read
+    dominator_id = Column(String, nullable=True, index=True)
     
     # Many-to-many relationship with tasks
     tasks = relationship(
         "Task",
         secondary=schedule_tasks,
-        backref="schedules"
+        back_populates="schedules"
     )
     
     def __repr__(self):
@@ -60,9 +76,10 @@ class ScheduleBase(BaseModel):
     start_date: datetime
     end_date: datetime
     
-    @validator('end_date')
-    def end_date_after_start_date(cls, v, values):
-        if 'start_date' in values and v < values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info: ValidationInfo):
+        if 'start_date' in info.data and v < info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
 
@@ -75,9 +92,10 @@ class ScheduleUpdate(BaseModel):
     end_date: Optional[datetime] = None
     tasks: Optional[List[ScheduleTaskInfo]] = None
     
-    @validator('end_date')
-    def end_date_after_start_date(cls, v, values):
-        if v is not None and 'start_date' in values and values['start_date'] is not None and v < values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info: ValidationInfo):
+        if v is not None and 'start_date' in info.data and info.data['start_date'] is not None and v < info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
 
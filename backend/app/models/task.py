@@ -1,10 +1,10 @@
 import enum
 import uuid
-from sqlalchemy import Column, String, Integer, Float, DateTime, Enum, Boolean, ForeignKey, Table
+from sqlalchemy import Column, String, Integer, Float, DateTime, Enum, Boolean, ForeignKey, Table, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 from .base import Base
 
@@ -48,6 +48,11 @@ class Task(Base):
     deadline = Column(DateTime, nullable=True)  # optional deadline
     status = Column(Enum(TaskStatus), default=TaskStatus.TODO)
     
+    # Covers the status/category/priority filters of the task list endpoint
+    __table_args__ = (
+        Index("ix_tasks_status_category_priority", "status", "category", "priority"),
+    )
+    
     # Self-referential relationship for dependencies
     # Thanks to StackOverflow for helping with this nightmare
     dependencies = relationship(
@@ -55,11 +60,21 @@ class Task(Base):
         secondary=task_dependencies,
         primaryjoin=id==task_dependencies.c.task_id,
         secondaryjoin=id==task_dependencies.c.dependency_id,
-        backref="dependent_tasks"
+        back_populates="dependent_tasks"
+    )
+    dependent_tasks = relationship(
+        "Task",
+        secondary=task_dependencies,
+        primaryjoin=id==task_dependencies.c.dependency_id,
+        secondaryjoin=id==task_dependencies.c.task_id,
+        back_populates="dependencies"
     )
     
-    # We'll add this once the Schedule model is created
-    # schedules = relationship("ScheduleTask", back_populates="task")
+    schedules = relationship(
+        "Schedule",
+        secondary="schedule_tasks",
+        back_populates="tasks"
+    )
     
     def __repr__(self):
         return f"<Task {self.title} ({self.status.value})>"
@@ -85,13 +100,15 @@ class TaskBase(BaseModel):
     priority: int  # 1-5
     deadline: Optional[datetime] = None
     
-    @validator('priority')
+    @field_validator('priority')
+    @classmethod
     def priority_range(cls, v):
         if not 1 <= v <= 5:
             raise ValueError('Priority must be between 1 and 5')
         return v
     
-    @validator('energy_cost')
+    @field_validator('energy_cost')
+    @classmethod
     def energy_range(cls, v):
         if not 1 <= v <= 10:
             raise ValueError('Energy cost must be between 1 and 10')
@@ -113,13 +130,15 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
     dependencies: Optional[List[str]] = None
     
-    @validator('priority')
+    @field_validator('priority')
+    @classmethod
     def priority_range(cls, v):
         if v is not None and not (1 <= v <= 5):
             raise ValueError('Priority must be between 1 and 5')
         return v
     
-    @validator('energy_cost')
+    @field_validator('energy_cost')
+    @classmethod
     def energy_range(cls, v):
         if v is not None and not (1 <= v <= 10):
             raise ValueError('Energy cost must be between 1 and 10')
@@ -1,17 +1,35 @@
 from typing import List, Optional, Dict
 import uuid
+from sqlalchemy import case, func, update
 from sqlalchemy.orm import Session
 
 from ..models.objective import Objective, ObjectiveCreate, ObjectiveUpdate
 from ..models.task import TaskCategory
+from ..core.objective_registry import objective_registry
+
+# Progress percentage of an objective, capped at 100 (SQL expression)
+_PROGRESS_RATIO = Objective.current_value / Objective.target_value * 100
+_PROGRESS_PERCENTAGE = case(
+    # Handle division by zero
+    (Objective.target_value == 0, case((Objective.current_value >= 0, 100.0), else_=0.0)),
+    (_PROGRESS_RATIO > 100.0, 100.0),
+    else_=_PROGRESS_RATIO
+)
 
 class ObjectiveService:
     """Service for objective-related operations"""
     
     @staticmethod
-    def get_objectives(db: Session, skip: int = 0, limit: int = 100) -> List[Objective]:
-        """Get all objectives with pagination"""
-        return db.query(Objective).offset(skip).limit(limit).all()
+    def get_objectives(db: Session, skip: int = 0, limit: int = 100,
+                       after: Optional[str] = None) -> List[Objective]:
+        """Get all objectives with pagination (keyset when after is given)"""
+        query = db.query(Objective).order_by(Objective.id)
+        
+        if after is not None:
+            # Seek past the last ID of the previous page instead of scanning skipped rows
+            return query.filter(Objective.id > after).limit(limit).all()
+        
+        return query.offset(skip).limit(limit).all()
     
     @staticmethod
     def get_objective(db: Session, objective_id: str) -> Optional[Objective]:
@@ -34,25 +52,49 @@ class ObjectiveService:
         db.add(db_objective)
         db.commit()
         db.refresh(db_objective)
+        
+        # Reserve the objective's column in score arrays up front
+        objective_registry.register(db_objective.id)
         return db_objective
     
     @staticmethod
     def update_objective(db: Session, objective_id: str, 
                        objective: ObjectiveUpdate) -> Optional[Objective]:
         """Update an existing objective"""
-        db_objective = db.query(Objective).filter(Objective.id == objective_id).first()
+        # Update objective fields if provided
+        update_data = objective.model_dump(exclude_unset=True)
+        
+        if not update_data:
+            return ObjectiveService.get_objective(db, objective_id)
+        
+        return ObjectiveService._update_by_id(db, objective_id, update_data)
+    
+    @staticmethod
+    def _update_by_id(db: Session, objective_id: str, values: Dict) -> Optional[Objective]:
+        """
+        Update an objective's columns without loading it first.
+        
+        Args:
+            db: Database session
+            objective_id: ID of the objective to update
+            values: Column values to set
+            
+        Returns:
+            The updated objective, or None if there is no such objective
+        """
+        # One UPDATE ... RETURNING both writes the row and hands it back
+        stmt = (
+            update(Objective)
+            .where(Objective.id == objective_id)
+            .values(**values)
+            .returning(Objective)
+        )
+        db_objective = db.execute(stmt).scalar_one_or_none()
         
         if not db_objective:
             return None
-            
-        # Update objective fields if provided
-        update_data = objective.dict(exclude_unset=True)
         
-        for key, value in update_data.items():
-            setattr(db_objective, key, value)
-            
         db.commit()
-        db.refresh(db_objective)
         return db_objective
     
     @staticmethod
@@ -76,82 +118,53 @@ class ObjectiveService:
     def update_objective_progress(db: Session, objective_id: str, 
                                 value: float) -> Optional[Objective]:
         """Update the current value of an objective"""
-        db_objective = db.query(Objective).filter(Objective.id == objective_id).first()
-        
-        if not db_objective:
-            return None
-            
-        db_objective.current_value = value
-        db.commit()
-        db.refresh(db_objective)
-        return db_objective
+        return ObjectiveService._update_by_id(db, objective_id, {"current_value": value})
     
     @staticmethod
     def normalize_weights(db: Session) -> None:
         """Normalize all objective weights to sum to 1.0"""
-        objectives = db.query(Objective).all()
+        # Sum and count the weights in one query (the sum is None when there
+        # are no objectives)
+        total_weight, count = db.query(func.sum(Objective.weight), func.count(Objective.id)).one()
         
-        if not objectives:
+        if total_weight is None:
             return
-            
-        # Calculate sum of all weights
-        total_weight = sum(obj.weight for obj in objectives)
         
+        # Rescale every row with one UPDATE instead of loading and saving each
         if total_weight == 0:
             # If all weights are zero, distribute evenly
-            even_weight = 1.0 / len(objectives)
-            for obj in objectives:
-                obj.weight = even_weight
+            new_weight = 1.0 / count
         else:
             # Normalize weights to sum to 1.0
-            for obj in objectives:
-                obj.weight = obj.weight / total_weight
-                
+            new_weight = Objective.weight / total_weight
+        
+        db.query(Objective).update({Objective.weight: new_weight}, synchronize_session=False)
         db.commit()
     
     @staticmethod
     def get_progress_percentages(db: Session) -> Dict[str, float]:
         """Calculate progress percentage for all objectives"""
-        objectives = db.query(Objective).all()
-        
-        if not objectives:
-            return {}
-            
-        progress = {}
-        
-        for obj in objectives:
-            if obj.target_value == 0:
-                # Handle division by zero
-                percent = 100.0 if obj.current_value >= 0 else 0.0
-            else:
-                percent = min(100.0, (obj.current_value / obj.target_value) * 100)
-                
-            progress[obj.id] = percent
-            
-        return progress
+        # Let the database compute each percentage and return (id, percent) rows
+        rows = db.query(Objective.id, _PROGRESS_PERCENTAGE).all()
+        return {obj_id: float(percent) for obj_id, percent in rows}
     
     @staticmethod
     def calculate_overall_progress(db: Session) -> float:
         """Calculate weighted average progress across all objectives"""
-        objectives = db.query(Objective).all()
+        # Aggregate in SQL so only a single row comes back
+        total_weight, weighted_sum, average, count = db.query(
+            func.sum(Objective.weight),
+            func.sum(_PROGRESS_PERCENTAGE * Objective.weight),
+            func.avg(_PROGRESS_PERCENTAGE),
+            func.count(Objective.id)
+        ).one()
         
-        if not objectives:
+        if not count:
             return 0.0
-            
-        progress_values = ObjectiveService.get_progress_percentages(db)
-        
-        # Calculate sum of all weights
-        total_weight = sum(obj.weight for obj in objectives)
         
         if total_weight == 0:
             # If all weights are zero, use simple average
-            return sum(progress_values.values()) / len(progress_values) if progress_values else 0.0
-            
-        # Calculate weighted average
-        weighted_sum = 0.0
+            return float(average)
         
-        for obj in objectives:
-            if obj.id in progress_values:
-                weighted_sum += progress_values[obj.id] * (obj.weight / total_weight)
-                
-        return weighted_sum
\ No newline at end of file
+        # Calculate weighted average
+        return float(weighted_sum / total_weight)
\ No newline at end of file
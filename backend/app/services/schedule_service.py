@@ -1,194 +1,341 @@
 from typing import List, Optional, Dict, Any
 import uuid
 import json
-from sqlalchemy.orm import Session
+import threading
+from contextlib import contextmanager
+from sqlalchemy import text
+from sqlalchemy.orm import Session, selectinload, load_only
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime, timedelta
 
-from ..models.schedule import Schedule, ScheduleCreate, ScheduleUpdate, ScheduleTaskInfo
+from ..models.schedule import Schedule, ScheduleCreate, ScheduleUpdate, ScheduleTaskInfo, schedule_tasks
 from ..models.task import Task
 from ..models.objective import Objective
 from ..models.constraints import TimeConstraints
-from ..core.pareto import calculate_pareto_front, normalize_scores
+from ..core.pareto import calculate_pareto_front, normalize_scores, find_dominator, find_dominated
 from ..core.scheduler import generate_feasible_schedules, is_schedule_feasible
 from ..core.scoring import calculate_objective_scores
 
+# Tasks of the loaded schedules and, for the dependency checks, their
+# dependencies, each in one extra query for all rows instead of one per row
+_WITH_TASKS = selectinload(Schedule.tasks).selectinload(Task.dependencies)
+
+# Columns needed to place schedules relative to the Pareto front
+_DOMINANCE_COLUMNS = load_only(
+    Schedule.id, Schedule.objective_scores, Schedule.pareto_rank,
+    Schedule.is_dominated, Schedule.dominator_id
+)
+
+# Whether this process has rebuilt the Pareto front from scratch yet. Writes
+# keep is_dominated/dominator_id current afterwards, so the full O(N^2) pass
+# only runs once per process to repair rows written before maintenance existed
+_front_synced = False
+
+# Front updates read the current front and then write is_dominated and
+# dominator_id, so two of them must never interleave. The lock covers the
+# threads of this process; on PostgreSQL a transaction-level advisory lock
+# covers the other worker processes too, until the update commits
+_front_lock = threading.Lock()
+_FRONT_LOCK_KEY = 0x50415245544F  # "PARETO"
+_ADVISORY_LOCK = text("SELECT pg_advisory_xact_lock(:key)")
+
+@contextmanager
+def _front_update(db: Session):
+    """Hold the Pareto front locks for a write that commits inside the block"""
+    with _front_lock:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(_ADVISORY_LOCK, {"key": _FRONT_LOCK_KEY})
+        yield
+
 class ScheduleService:
     """Service for schedule-related operations"""
     
     @staticmethod
-    def get_schedules(db: Session, skip: int = 0, limit: int = 100) -> List[Schedule]:
-        """Get all schedules with pagination"""
-        return db.query(Schedule).offset(skip).limit(limit).all()
+    def get_schedules(db: Session, skip: int = 0, limit: int = 100,
+                      after: Optional[str] = None) -> List[Schedule]:
+        """Get all schedules with pagination (keyset when after is given)"""
+        query = db.query(Schedule).options(_WITH_TASKS).order_by(Schedule.id)
+        
+        if after is not None:
+            # Seek past the last ID of the previous page instead of scanning skipped rows
+            return query.filter(Schedule.id > after).limit(limit).all()
+        
+        return query.offset(skip).limit(limit).all()
     
     @staticmethod
     def get_schedule(db: Session, schedule_id: str) -> Optional[Schedule]:
         """Get a specific schedule by ID"""
-        return db.query(Schedule).filter(Schedule.id == schedule_id).first()
+        return db.query(Schedule).options(_WITH_TASKS).filter(Schedule.id == schedule_id).first()
     
     @staticmethod
-    def create_schedule(db: Session, schedule: ScheduleCreate) -> Schedule:
-        """Create a new schedule"""
-        # Create the schedule
-        db_schedule = Schedule(
-            name=schedule.name,
-            start_date=schedule.start_date,
-            end_date=schedule.end_date,
-            objective_scores={},
-            pareto_rank=0,
-            is_dominated=False
-        )
-        
-        db.add(db_schedule)
-        db.commit()
-        db.refresh(db_schedule)
-        
-        # Add tasks to the schedule
-        for task_info in schedule.tasks:
-            task = db.query(Task).filter(Task.id == task_info.task_id).first()
-            if task:
-                db_schedule.tasks.append(task)
-                # In a real implementation, we'd store the start time in the join table here
-                
-        db.commit()
-        db.refresh(db_schedule)
-        
-        # Calculate objective scores
-        objectives = db.query(Objective).all()
-        scores = calculate_objective_scores(db_schedule, objectives)
-        
-        # Store scores
-        db_schedule.objective_scores = scores
-        
-        db.commit()
-        db.refresh(db_schedule)
-        
-        return db_schedule
-    
-    @staticmethod
-    def update_schedule(db: Session, schedule_id: str, 
-                       schedule: ScheduleUpdate) -> Optional[Schedule]:
-        """Update an existing schedule"""
-        db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
-        
-        if not db_schedule:
-            return None
-            
-        # Update basic fields
-        update_data = schedule.dict(exclude_unset=True, exclude={"tasks"})
-        
-        for key, value in update_data.items():
-            setattr(db_schedule, key, value)
+    def create_schedule(db: Session, schedule: ScheduleCreate,
+                        objectives: Optional[List[Objective]] = None) -> Schedule:
+        """Create a new schedule (objectives are queried unless the caller already has them)"""
+        with _front_update(db):
+            # Create the schedule
+            db_schedule = Schedule(
+                name=schedule.name,
+                start_date=schedule.start_date,
+                end_date=schedule.end_date,
+                objective_scores={},
+                pareto_rank=0,
+                is_dominated=False
+            )
             
-        # Update tasks if provided
-        if schedule.tasks is not None:
-            # Clear existing tasks
-            db_schedule.tasks = []
+            db.add(db_schedule)
+            db.flush()  # assigns the ID
             
-            # Add new tasks
-            for task_info in schedule.tasks:
-                task = db.query(Task).filter(Task.id == task_info.task_id).first()
-                if task:
-                    db_schedule.tasks.append(task)
-                    # In a real implementation, we'd store the start time in the join table here
+            # Add tasks to the schedule
+            ScheduleService._link_tasks(db, db_schedule, schedule.tasks)
             
-            # Recalculate objective scores
-            objectives = db.query(Objective).all()
+            # Calculate objective scores
+            if objectives is None:
+                objectives = db.query(Objective).all()
             scores = calculate_objective_scores(db_schedule, objectives)
             
             # Store scores
             db_schedule.objective_scores = scores
-        
-        db.commit()
-        db.refresh(db_schedule)
+            ScheduleService._add_to_front(db, db_schedule)
+            
+            db.commit()
+            db.refresh(db_schedule)
+            
         return db_schedule
     
+    @staticmethod
+    def update_schedule(db: Session, schedule_id: str, 
+                       schedule: ScheduleUpdate,
+                       objectives: Optional[List[Objective]] = None) -> Optional[Schedule]:
+        """Update an existing schedule (objectives are queried unless the caller already has them)"""
+        with _front_update(db):
+            db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+            
+            if not db_schedule:
+                return None
+                
+            # Update basic fields
+            update_data = schedule.model_dump(exclude_unset=True, exclude={"tasks"})
+            
+            for key, value in update_data.items():
+                setattr(db_schedule, key, value)
+                
+            # Update tasks if provided
+            if schedule.tasks is not None:
+                # Clear existing tasks
+                db.execute(schedule_tasks.delete().where(schedule_tasks.c.schedule_id == db_schedule.id))
+                
+                # Add new tasks
+                ScheduleService._link_tasks(db, db_schedule, schedule.tasks)
+                
+                # Recalculate objective scores
+                if objectives is None:
+                    objectives = db.query(Objective).all()
+                scores = calculate_objective_scores(db_schedule, objectives)
+                
+                # Store scores
+                db_schedule.objective_scores = scores
+                
+                # Re-place the schedule, then the schedules it was recorded as dominating
+                ScheduleService._add_to_front(db, db_schedule)
+                ScheduleService._recheck_dominated_by(db, db_schedule.id)
+            
+            db.commit()
+            db.refresh(db_schedule)
+        return db_schedule
+    
+    @staticmethod
+    def _link_tasks(db: Session, db_schedule: Schedule, task_infos: List[ScheduleTaskInfo]) -> None:
+        """
+        Link tasks to a flushed schedule with their start times.
+        
+        The tasks are fetched with one IN query and the schedule_tasks rows
+        written with one multi-row insert. Unknown task IDs are skipped, and
+        a task listed twice is linked once.
+        
+        Args:
+            db: Database session
+            db_schedule: Schedule with an ID and no linked tasks
+            task_infos: Tasks to link and their start times
+        """
+        task_ids = [task_info.task_id for task_info in task_infos]
+        found = {task.id: task for task in db.query(Task).filter(Task.id.in_(task_ids)).all()} if task_ids else {}
+        
+        tasks = []
+        rows = []
+        
+        for task_info in task_infos:
+            task = found.pop(task_info.task_id, None)
+            if task is not None:
+                tasks.append(task)
+                rows.append({"schedule_id": db_schedule.id, "task_id": task.id,
+                             "start_time": task_info.start_time})
+        
+        if rows:
+            db.execute(schedule_tasks.insert(), rows)
+        
+        # The rows are written already; show the collection as loaded so
+        # scoring can read it without a query and the ORM writes nothing more
+        set_committed_value(db_schedule, "tasks", tasks)
+    
     @staticmethod
     def delete_schedule(db: Session, schedule_id: str) -> bool:
         """Delete a schedule"""
-        db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
-        
-        if not db_schedule:
-            return False
+        with _front_update(db):
+            db_schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
             
-        db.delete(db_schedule)
-        db.commit()
+            if not db_schedule:
+                return False
+                
+            db.delete(db_schedule)
+            db.flush()
+            
+            # Only schedules that pointed at the deleted one can change front membership
+            ScheduleService._recheck_dominated_by(db, schedule_id)
+            db.commit()
         return True
     
     @staticmethod
     def generate_schedules(db: Session, constraints: TimeConstraints, 
-                         days: int = 7) -> List[Schedule]:
-        """Generate feasible schedules based on tasks and objectives"""
+                         days: int = 7,
+                         objectives: Optional[List[Objective]] = None) -> List[Schedule]:
+        """Generate feasible schedules based on tasks and objectives (queried unless given)"""
         # Get all tasks and objectives
-        tasks = db.query(Task).filter(Task.status != "COMPLETED").all()
-        objectives = db.query(Objective).all()
+        # The generators read every task's dependencies, so load them up front
+        tasks = db.query(Task).options(selectinload(Task.dependencies)).filter(
+            Task.status != "COMPLETED"
+        ).all()
+        if objectives is None:
+            objectives = db.query(Objective).all()
         
         # Generate schedules
         schedules = generate_feasible_schedules(tasks, objectives, constraints)
         
-        # Save schedules to database
-        db_schedules = []
-        
-        for schedule in schedules:
-            # Create new schedule
-            db_schedule = Schedule(
-                name=schedule.name,
-                start_date=schedule.start_date,
-                end_date=schedule.end_date,
-                objective_scores=schedule.objective_scores,
-                pareto_rank=schedule.pareto_rank,
-                is_dominated=schedule.is_dominated
-            )
+        with _front_update(db):
+            # Save all schedules in one transaction
+            db_schedules = [
+                Schedule(
+                    name=schedule.name,
+                    start_date=schedule.start_date,
+                    end_date=schedule.end_date,
+                    objective_scores=schedule.objective_scores,
+                    pareto_rank=schedule.pareto_rank,
+                    is_dominated=schedule.is_dominated
+                )
+                for schedule in schedules
+            ]
             
-            db.add(db_schedule)
-            db.commit()
-            db.refresh(db_schedule)
+            db.add_all(db_schedules)
+            db.flush()  # assigns the IDs
             
-            # Add tasks
-            for task in schedule.tasks:
-                db_task = db.query(Task).filter(Task.id == task.id).first()
-                if db_task:
-                    db_schedule.tasks.append(db_task)
-                    # In a real implementation, we'd store the start time in the join table here
+            # Link the tasks with their start times in one multi-row insert; the
+            # generated tasks are already the session's own Task rows
+            task_rows = [
+                {"schedule_id": db_schedule.id, "task_id": task_id, "start_time": start_time}
+                for schedule, db_schedule in zip(schedules, db_schedules)
+                for task_id, start_time in schedule.task_start_times.items()
+            ]
             
-            db.commit()
-            db.refresh(db_schedule)
-            db_schedules.append(db_schedule)
+            if task_rows:
+                db.execute(schedule_tasks.insert(), task_rows)
+            
+            # The generator only compared the new schedules with each other
+            for db_schedule in db_schedules:
+                ScheduleService._add_to_front(db, db_schedule)
             
+            db.commit()
+        
         return db_schedules
     
     @staticmethod
     def get_pareto_optimal_schedules(db: Session) -> List[Schedule]:
         """Get Pareto-optimal schedules"""
-        schedules = db.query(Schedule).all()
+        global _front_synced
+        
+        if not _front_synced:
+            with _front_update(db):
+                # Another request may have rebuilt it while this one waited
+                if not _front_synced:
+                    ScheduleService._rebuild_pareto_front(db)
+                    _front_synced = True
+        
+        # Writes keep the front up to date, so reading it is a plain query
+        return db.query(Schedule).options(_WITH_TASKS).filter(
+            Schedule.is_dominated.is_(False)
+        ).all()
+    
+    @staticmethod
+    def _rebuild_pareto_front(db: Session) -> None:
+        """Recompute front membership and dominator pointers for all schedules"""
+        schedules = db.query(Schedule).options(_DOMINANCE_COLUMNS).all()
         
         if not schedules:
-            return []
-            
-        # Normalize scores across schedules
-        # No need to convert string keys, we're using strings now
-        pass
-            
+            return
+        
         # Calculate Pareto front
         pareto_front = calculate_pareto_front(schedules)
         
-        # Update schedules in database
+        # Point every dominated schedule at a front member that dominates it
         for schedule in schedules:
-            # No need to convert keys, we're already using strings
-            db.add(schedule)
-            
+            if schedule.is_dominated:
+                schedule.dominator_id = find_dominator(schedule, pareto_front).id
+            else:
+                schedule.dominator_id = None
+        
         db.commit()
+    
+    @staticmethod
+    def _add_to_front(db: Session, schedule: Schedule) -> None:
+        """
+        Place a new or rescored schedule relative to the current Pareto front.
+        
+        Anything that dominates the schedule is dominated by some front member
+        too, so comparing against the front alone is enough.
+        """
+        front = db.query(Schedule).options(_DOMINANCE_COLUMNS).filter(
+            Schedule.is_dominated.is_(False),
+            Schedule.id != schedule.id
+        ).all()
+        
+        dominator = find_dominator(schedule, front)
         
-        # Return only Pareto-optimal schedules
-        return [s for s in schedules if s.pareto_rank == 0]
+        if dominator is not None:
+            schedule.is_dominated = True
+            schedule.dominator_id = dominator.id
+        else:
+            schedule.is_dominated = False
+            schedule.dominator_id = None
+            schedule.pareto_rank = 0
+            
+            # Evict the front members the schedule now dominates
+            for member in find_dominated(schedule, front):
+                member.is_dominated = True
+                member.dominator_id = schedule.id
+        
+        # Later front queries in this transaction must see the change
+        db.flush()
+    
+    @staticmethod
+    def _recheck_dominated_by(db: Session, schedule_id: str) -> None:
+        """Re-place the schedules whose recorded dominator was removed or rescored"""
+        orphans = db.query(Schedule).options(_DOMINANCE_COLUMNS).filter(
+            Schedule.dominator_id == schedule_id
+        ).all()
+        
+        # Any order works: an orphan that joins the front too early is evicted
+        # again by the orphan that dominates it
+        for orphan in orphans:
+            ScheduleService._add_to_front(db, orphan)
     
     @staticmethod
     def check_schedule_feasibility(db: Session, schedule_id: str, 
-                                 constraints: TimeConstraints) -> bool:
-        """Check if a schedule is feasible given constraints"""
-        schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+                                 constraints: TimeConstraints) -> Optional[bool]:
+        """Check if a schedule is feasible given constraints (None if it doesn't exist)"""
+        # Tasks and their dependencies come with the schedule, so the check
+        # itself doesn't query
+        schedule = ScheduleService.get_schedule(db, schedule_id)
         
         if not schedule:
-            return False
+            return None
             
         return is_schedule_feasible(schedule, constraints)
     
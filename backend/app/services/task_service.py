@@ -1,18 +1,37 @@
 from typing import List, Optional, Dict, Set
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from fastapi import HTTPException, status
 
-from ..models.task import Task, TaskCreate, TaskUpdate, TaskStatus, TaskCategory
+from ..models.task import Task, TaskCreate, TaskUpdate, TaskStatus, TaskCategory, task_dependencies
 from ..models.base import Base
 
 class TaskService:
     """Service for task-related operations"""
     
     @staticmethod
-    def get_tasks(db: Session, skip: int = 0, limit: int = 100) -> List[Task]:
-        """Get all tasks with pagination"""
-        return db.query(Task).offset(skip).limit(limit).all()
+    def get_tasks(db: Session, skip: int = 0, limit: int = 100,
+                  status: Optional[TaskStatus] = None,
+                  category: Optional[TaskCategory] = None,
+                  min_priority: Optional[int] = None,
+                  after: Optional[str] = None) -> List[Task]:
+        """Get tasks with optional filtering and pagination (keyset when after is given)"""
+        # Load the dependencies of the whole page in one extra query instead of one per task
+        query = db.query(Task).options(selectinload(Task.dependencies)).order_by(Task.id)
+        
+        # Filter in SQL so pagination applies to the filtered rows
+        if status is not None:
+            query = query.filter(Task.status == status)
+        if category is not None:
+            query = query.filter(Task.category == category)
+        if min_priority is not None:
+            query = query.filter(Task.priority >= min_priority)
+        
+        if after is not None:
+            # Seek past the last ID of the previous page instead of scanning skipped rows
+            return query.filter(Task.id > after).limit(limit).all()
+        
+        return query.offset(skip).limit(limit).all()
     
     @staticmethod
     def get_task(db: Session, task_id: str) -> Optional[Task]:
@@ -23,14 +42,7 @@ class TaskService:
     def create_task(db: Session, task: TaskCreate) -> Task:
         """Create a new task"""
         # Check if dependencies exist
-        if task.dependencies:
-            for dep_id in task.dependencies:
-                dep = db.query(Task).filter(Task.id == dep_id).first()
-                if not dep:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Dependency task with ID {dep_id} not found"
-                    )
+        dependencies = TaskService._get_dependencies(db, task.dependencies)
         
         # Create new task
         db_task = Task(
@@ -49,10 +61,8 @@ class TaskService:
         db.refresh(db_task)
         
         # Add dependencies
-        if task.dependencies:
-            for dep_id in task.dependencies:
-                dep = db.query(Task).filter(Task.id == dep_id).first()
-                db_task.dependencies.append(dep)
+        if dependencies:
+            db_task.dependencies.extend(dependencies)
             
             db.commit()
             db.refresh(db_task)
@@ -68,30 +78,14 @@ class TaskService:
             return None
         
         # Update task fields if provided
-        update_data = task.dict(exclude_unset=True)
+        update_data = task.model_dump(exclude_unset=True)
         
         # Handle dependencies separately
         if "dependencies" in update_data:
             dependencies = update_data.pop("dependencies")
             
-            # Validate dependencies
-            if dependencies:
-                for dep_id in dependencies:
-                    dep = db.query(Task).filter(Task.id == dep_id).first()
-                    if not dep:
-                        raise HTTPException(
-                            status_code=status.HTTP_404_NOT_FOUND,
-                            detail=f"Dependency task with ID {dep_id} not found"
-                        )
-            
-            # Clear existing dependencies
-            db_task.dependencies = []
-            
-            # Add new dependencies
-            if dependencies:
-                for dep_id in dependencies:
-                    dep = db.query(Task).filter(Task.id == dep_id).first()
-                    db_task.dependencies.append(dep)
+            # Validate dependencies, then replace the existing ones
+            db_task.dependencies = TaskService._get_dependencies(db, dependencies)
         
         # Update other fields
         for key, value in update_data.items():
@@ -101,6 +95,37 @@ class TaskService:
         db.refresh(db_task)
         return db_task
     
+    @staticmethod
+    def _get_dependencies(db: Session, dependency_ids: Optional[List[str]]) -> List[Task]:
+        """
+        Fetch the tasks with the given IDs in one query.
+        
+        Args:
+            db: Database session
+            dependency_ids: IDs of the dependency tasks
+            
+        Returns:
+            The tasks in the order of their IDs, each once
+            
+        Raises:
+            HTTPException: 404 naming the first ID with no task
+        """
+        if not dependency_ids:
+            return []
+        
+        # Repeated IDs would insert the same association row twice
+        unique_ids = list(dict.fromkeys(dependency_ids))
+        found = {dep.id: dep for dep in db.query(Task).filter(Task.id.in_(unique_ids)).all()}
+        
+        for dep_id in unique_ids:
+            if dep_id not in found:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Dependency task with ID {dep_id} not found"
+                )
+        
+        return [found[dep_id] for dep_id in unique_ids]
+    
     @staticmethod
     def delete_task(db: Session, task_id: str) -> bool:
         """Delete a task"""
@@ -136,29 +161,25 @@ class TaskService:
         
         Returns True if circular dependency detected, False otherwise.
         """
-        # Helper function to find all indirect dependencies
-        def get_all_dependencies(tid: str, visited: Set[str] = None) -> Set[str]:
-            if visited is None:
-                visited = set()
-                
+        # Load the whole dependency graph with one query instead of one per task
+        adjacency: Dict[str, List[str]] = {}
+        edges = db.query(task_dependencies.c.task_id, task_dependencies.c.dependency_id).all()
+        for tid, dep_id in edges:
+            adjacency.setdefault(tid, []).append(dep_id)
+        
+        # Walk every dependency reachable from the new ones; if the task
+        # itself shows up, it would end up depending on itself
+        stack = list(dependency_ids)
+        visited: Set[str] = set()
+        
+        while stack:
+            tid = stack.pop()
+            if tid == task_id:
+                return True
             if tid in visited:
-                return visited
-                
-            visited.add(tid)
+                continue
             
-            task = db.query(Task).filter(Task.id == tid).first()
-            if not task:
-                return visited
-                
-            for dep in task.dependencies:
-                get_all_dependencies(dep.id, visited)
-                
-            return visited
-        
-        # Check if the task appears in its own dependency tree
-        for dep_id in dependency_ids:
-            all_indirect_deps = get_all_dependencies(dep_id)
-            if task_id in all_indirect_deps:
-                return True
-                
+            visited.add(tid)
+            stack.extend(adjacency.get(tid, ()))
+        
         return False
\ No newline at end of file
@@ -1,17 +1,22 @@
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-from app.models.base import Base, engine, get_db
+from app.models.base import Base, engine, get_db, add_missing_columns
 from app.api import tasks, objectives, schedules
 
-# Create database tables
+# Create database tables, and add columns that tables from older versions lack
 Base.metadata.create_all(bind=engine)
+add_missing_columns(engine)
 
 app = FastAPI(
     title="Pareto Life Planner API",
     description="A multi-objective life planner using Pareto optimization",
-    version="0.1.0"
+    version="0.1.0",
+    # orjson encodes datetimes and large lists much faster than the stdlib
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -40,12 +45,17 @@ async def root():
         }
     }
 
+# Built once; SQLAlchemy 2.0 only executes textual SQL wrapped in text()
+_HEALTH_CHECK_QUERY = text("SELECT 1")
+
+# Plain def on purpose: the query uses a blocking Session, so FastAPI must run
+# this in its threadpool instead of on the event loop
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     """Health check endpoint that also verifies database connection"""
     try:
         # Execute a simple query to verify database connection
-        db.execute("SELECT 1")
+        db.execute(_HEALTH_CHECK_QUERY).scalar()
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
@@ -1,95 +1,93 @@
 import unittest
 import uuid
 from datetime import datetime, timedelta, time
-import sys
-import os
+from contextlib import contextmanager
+from unittest.mock import patch
+import numpy as np
 
-# Add parent directory to path so we can import app modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
 
+from backend.app.models.base import Base, add_missing_columns
 from backend.app.models.task import Task, TaskCategory, TaskStatus
 from backend.app.models.objective import Objective, TimeFrame
-from backend.app.models.schedule import Schedule
+from backend.app.models.schedule import Schedule, schedule_tasks
 from backend.app.models.constraints import TimeConstraints, TimeSlot, DayOfWeek
 from backend.app.core.pareto import (
     is_dominated, calculate_pareto_front, calculate_pareto_ranks, normalize_scores
 )
 from backend.app.core.scheduler import (
-    is_schedule_feasible, generate_feasible_schedules
+    is_schedule_feasible, generate_feasible_schedules, check_time_slot_overlap,
+    calculate_objective_scores as calculate_generated_scores, _objective_score_matrix
 )
-from backend.app.core.scoring import calculate_objective_scores
+from backend.app.core.scoring import (
+    calculate_objective_scores, calculate_weighted_score, calculate_weighted_scores
+)
+from backend.app.services.schedule_service import ScheduleService
+
+@contextmanager
+def count_queries(engine):
+    """Collect the SQL statements executed on the engine inside the block"""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+# Fixed dates for the fixtures; no test depends on the wall clock
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+FIXED_END = FIXED_NOW + timedelta(days=7)
+
+def make_schedule(schedule_id, name, objective_scores):
+    """Build a week-long schedule with the given objective scores"""
+    return Schedule(
+        id=schedule_id,
+        name=name,
+        start_date=FIXED_NOW,
+        end_date=FIXED_END,
+        objective_scores=objective_scores,
+        pareto_rank=0,
+        is_dominated=False
+    )
 
 class TestParetoFunctions(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # The fixtures are only read, so build them once for the whole class
         # Create test schedules with different objective scores
-        self.schedule1 = Schedule(
-            id="1",
-            name="Schedule 1",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                "obj1": 0.8,  # High for objective 1
-                "obj2": 0.4   # Medium for objective 2
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        cls.schedule1 = make_schedule("1", "Schedule 1", {
+            "obj1": 0.8,  # High for objective 1
+            "obj2": 0.4   # Medium for objective 2
+        })
         
-        self.schedule2 = Schedule(
-            id="2",
-            name="Schedule 2",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                "obj1": 0.5,  # Medium for objective 1
-                "obj2": 0.9   # High for objective 2
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        cls.schedule2 = make_schedule("2", "Schedule 2", {
+            "obj1": 0.5,  # Medium for objective 1
+            "obj2": 0.9   # High for objective 2
+        })
         
-        self.schedule3 = Schedule(
-            id="3",
-            name="Schedule 3",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                "obj1": 0.3,  # Low for objective 1
-                "obj2": 0.2   # Low for objective 2
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        cls.schedule3 = make_schedule("3", "Schedule 3", {
+            "obj1": 0.3,  # Low for objective 1
+            "obj2": 0.2   # Low for objective 2
+        })
         
         # Create better versions of the schedules with same objectives
         obj1_id = "obj1"
         obj2_id = "obj2"
         
-        self.dominated_schedule = Schedule(
-            id="4",
-            name="Dominated Schedule",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.2,  # Lower than schedule1 and schedule2
-                obj2_id: 0.3   # Lower than schedule1 and schedule2
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        cls.dominated_schedule = make_schedule("4", "Dominated Schedule", {
+            obj1_id: 0.2,  # Lower than schedule1 and schedule2
+            obj2_id: 0.3   # Lower than schedule1 and schedule2
+        })
         
-        self.dominating_schedule = Schedule(
-            id="5",
-            name="Dominating Schedule",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.9,  # Higher than all others
-                obj2_id: 0.9   # Higher than all others
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        cls.dominating_schedule = make_schedule("5", "Dominating Schedule", {
+            obj1_id: 0.9,  # Higher than all others
+            obj2_id: 0.9   # Higher than all others
+        })
     
     def test_is_dominated(self):
         """Test the is_dominated function with dominated and non-dominated schedules"""
@@ -97,60 +95,28 @@ class TestParetoFunctions(unittest.TestCase):
         obj1_id = "test1"
         obj2_id = "test2"
         
-        schedule_a = Schedule(
-            id="a",
-            name="Schedule A",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.5,
-                obj2_id: 0.5
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_a = make_schedule("a", "Schedule A", {
+            obj1_id: 0.5,
+            obj2_id: 0.5
+        })
         
         # B dominates A (better in all objectives)
-        schedule_b = Schedule(
-            id="b",
-            name="Schedule B",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.8,
-                obj2_id: 0.7
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_b = make_schedule("b", "Schedule B", {
+            obj1_id: 0.8,
+            obj2_id: 0.7
+        })
         
         # C doesn't dominate A (better in one, worse in another)
-        schedule_c = Schedule(
-            id="c",
-            name="Schedule C",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.9,
-                obj2_id: 0.3
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_c = make_schedule("c", "Schedule C", {
+            obj1_id: 0.9,
+            obj2_id: 0.3
+        })
         
         # D doesn't dominate A (equal in all objectives)
-        schedule_d = Schedule(
-            id="d",
-            name="Schedule D",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.5,
-                obj2_id: 0.5
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_d = make_schedule("d", "Schedule D", {
+            obj1_id: 0.5,
+            obj2_id: 0.5
+        })
         
         # Test dominance relationships
         self.assertTrue(is_dominated(schedule_a, schedule_b))
@@ -159,6 +125,10 @@ class TestParetoFunctions(unittest.TestCase):
         self.assertFalse(is_dominated(schedule_c, schedule_a))
         self.assertFalse(is_dominated(schedule_a, schedule_d))
         self.assertFalse(is_dominated(schedule_d, schedule_a))
+        
+        # Editing the scores in place is picked up by later checks
+        schedule_b.objective_scores[obj2_id] = 0.4
+        self.assertFalse(is_dominated(schedule_a, schedule_b))
     
     def test_calculate_pareto_front(self):
         """Test calculation of the Pareto front"""
@@ -166,72 +136,32 @@ class TestParetoFunctions(unittest.TestCase):
         obj1_id = "obj1"
         obj2_id = "obj2"
         
-        schedule_a = Schedule(
-            id="a1",
-            name="Schedule A",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.5,
-                obj2_id: 0.5
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_a = make_schedule("a1", "Schedule A", {
+            obj1_id: 0.5,
+            obj2_id: 0.5
+        })
         
-        schedule_b = Schedule(
-            id="b1",
-            name="Schedule B",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.8,
-                obj2_id: 0.2
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_b = make_schedule("b1", "Schedule B", {
+            obj1_id: 0.8,
+            obj2_id: 0.2
+        })
         
-        schedule_c = Schedule(
-            id="c1",
-            name="Schedule C",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.2,
-                obj2_id: 0.8
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_c = make_schedule("c1", "Schedule C", {
+            obj1_id: 0.2,
+            obj2_id: 0.8
+        })
         
         # Dominated by B
-        schedule_d = Schedule(
-            id="d1",
-            name="Schedule D",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.7,
-                obj2_id: 0.1
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_d = make_schedule("d1", "Schedule D", {
+            obj1_id: 0.7,
+            obj2_id: 0.1
+        })
         
         # Dominated by C
-        schedule_e = Schedule(
-            id="e1",
-            name="Schedule E",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 0.1,
-                obj2_id: 0.7
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_e = make_schedule("e1", "Schedule E", {
+            obj1_id: 0.1,
+            obj2_id: 0.7
+        })
         
         # Test Pareto front calculation
         schedules = [schedule_a, schedule_b, schedule_c, schedule_d, schedule_e]
@@ -245,50 +175,83 @@ class TestParetoFunctions(unittest.TestCase):
         self.assertNotIn(schedule_d, pareto_front)
         self.assertNotIn(schedule_e, pareto_front)
     
+    def test_calculate_pareto_ranks(self):
+        """Test ranking schedules into successive Pareto fronts"""
+        obj1_id = "rank1"
+        obj2_id = "rank2"
+        
+        schedule_a = make_schedule("rank_a", "Schedule rank_a", {obj1_id: 0.5, obj2_id: 0.5})
+        schedule_b = make_schedule("rank_b", "Schedule rank_b", {obj1_id: 0.8, obj2_id: 0.2})
+        schedule_c = make_schedule("rank_c", "Schedule rank_c", {obj1_id: 0.2, obj2_id: 0.8})
+        schedule_d = make_schedule("rank_d", "Schedule rank_d", {obj1_id: 0.7, obj2_id: 0.1})  # Dominated by B
+        schedule_e = make_schedule("rank_e", "Schedule rank_e", {obj1_id: 0.1, obj2_id: 0.7})  # Dominated by C
+        schedule_f = make_schedule("rank_f", "Schedule rank_f", {obj1_id: 0.05, obj2_id: 0.05})  # Dominated by D and E
+        
+        schedules = [schedule_f, schedule_a, schedule_d, schedule_b, schedule_e, schedule_c]
+        ranks = calculate_pareto_ranks(schedules)
+        
+        # Fronts keep the input order of their members
+        self.assertEqual(ranks[0], [schedule_a, schedule_b, schedule_c])
+        self.assertEqual(ranks[1], [schedule_d, schedule_e])
+        self.assertEqual(ranks[2], [schedule_f])
+        self.assertEqual(len(ranks), 3)
+        
+        self.assertEqual(schedule_f.pareto_rank, 2)
+        self.assertFalse(schedule_a.is_dominated)
+        self.assertTrue(schedule_d.is_dominated)
+    
+    def test_pareto_three_objectives_with_ties(self):
+        """Fronts and ranks with 3+ objectives and tied scores match a brute-force pairwise check"""
+        # Scores on a coarse grid, so many schedules tie on some objectives and
+        # a few are identical
+        rng = np.random.default_rng(7)
+        
+        for n_objectives in (3, 4):
+            obj_ids = [f"tie{j}" for j in range(n_objectives)]
+            grid = rng.integers(0, 4, size=(60, n_objectives)) / 4
+            schedules = [
+                make_schedule(f"tie_{n_objectives}_{i}", f"Schedule {i}", dict(zip(obj_ids, row.tolist())))
+                for i, row in enumerate(grid)
+            ]
+            # An exact duplicate of a front member stays on the front with it
+            best = max(schedules, key=lambda schedule: sum(schedule.objective_scores.values()))
+            schedules.append(make_schedule(f"tie_{n_objectives}_dup", "Duplicate", dict(best.objective_scores)))
+            
+            # Brute force: peel off the schedules no remaining schedule dominates
+            expected_ranks = []
+            remaining = list(schedules)
+            while remaining:
+                front = [s for s in remaining if not any(is_dominated(s, other) for other in remaining)]
+                expected_ranks.append(front)
+                remaining = [s for s in remaining if s not in front]
+            
+            self.assertGreater(len(expected_ranks), 2)
+            self.assertEqual(calculate_pareto_front(schedules), expected_ranks[0])
+            self.assertIn(schedules[-1], expected_ranks[0])
+            
+            ranks = calculate_pareto_ranks(schedules)
+            self.assertEqual([ranks[rank] for rank in sorted(ranks)], expected_ranks)
+    
     def test_normalize_scores(self):
         """Test normalization of objective scores"""
         # Create schedules with different raw scores
         obj1_id = "norm1"
         obj2_id = "norm2"
         
-        schedule_a = Schedule(
-            id="norm_a",
-            name="Schedule A",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 10.0,
-                obj2_id: 5.0
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_a = make_schedule("norm_a", "Schedule A", {
+            obj1_id: 10.0,
+            obj2_id: 5.0
+        })
         
-        schedule_b = Schedule(
-            id="norm_b",
-            name="Schedule B",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 20.0,
-                obj2_id: 15.0
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_b = make_schedule("norm_b", "Schedule B", {
+            obj1_id: 20.0,
+            obj2_id: 15.0
+        })
         
-        schedule_c = Schedule(
-            id="norm_c",
-            name="Schedule C",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
-            objective_scores={
-                obj1_id: 30.0,
-                obj2_id: 25.0
-            },
-            pareto_rank=0,
-            is_dominated=False
-        )
+        schedule_c = make_schedule("norm_c", "Schedule C", {
+            obj1_id: 30.0,
+            obj2_id: 25.0
+        })
         
         schedules = [schedule_a, schedule_b, schedule_c]
         
@@ -306,34 +269,11 @@ class TestParetoFunctions(unittest.TestCase):
         self.assertAlmostEqual(schedule_b.objective_scores[obj2_id], 0.5)  # Middle value
 
 class TestSchedulerFunctions(unittest.TestCase):
-    def setUp(self):
-        # Create test tasks
-        self.task1 = Task(
-            id="task1",
-            title="Task 1",
-            description="Description 1",
-            duration=60,  # 1 hour
-            energy_cost=3,
-            category=TaskCategory.WORK,
-            priority=3,
-            deadline=None,
-            status=TaskStatus.TODO
-        )
-        
-        self.task2 = Task(
-            id="task2",
-            title="Task 2",
-            description="Description 2",
-            duration=120,  # 2 hours
-            energy_cost=5,
-            category=TaskCategory.HEALTH,
-            priority=4,
-            deadline=None,
-            status=TaskStatus.TODO
-        )
-        
-        # Create test objectives
-        self.objective1 = Objective(
+    @classmethod
+    def setUpClass(cls):
+        # Create test objectives; they and the constraints are only read,
+        # so they are built once for the whole class
+        cls.objective1 = Objective(
             id="obj1",
             name="Work Objective",
             category=TaskCategory.WORK,
@@ -344,7 +284,7 @@ class TestSchedulerFunctions(unittest.TestCase):
             time_frame=TimeFrame.WEEKLY
         )
         
-        self.objective2 = Objective(
+        cls.objective2 = Objective(
             id="obj2",
             name="Health Objective",
             category=TaskCategory.HEALTH,
@@ -356,37 +296,64 @@ class TestSchedulerFunctions(unittest.TestCase):
         )
         
         # Create test constraints
-        self.morning_slot = TimeSlot(
+        cls.morning_slot = TimeSlot(
             day=DayOfWeek.MONDAY,
             start_time=time(9, 0),
             end_time=time(12, 0)
         )
         
-        self.afternoon_slot = TimeSlot(
+        cls.afternoon_slot = TimeSlot(
             day=DayOfWeek.MONDAY,
             start_time=time(13, 0),
             end_time=time(17, 0)
         )
         
         # For testing we'll use a different evening slot that doesn't cross midnight
-        self.evening_slot = TimeSlot(
+        cls.evening_slot = TimeSlot(
             day=DayOfWeek.MONDAY,
             start_time=time(18, 0),
             end_time=time(22, 0)
         )
         
-        self.constraints = TimeConstraints(
-            available_slots=[self.morning_slot, self.afternoon_slot, self.evening_slot],
+        cls.constraints = TimeConstraints(
+            available_slots=[cls.morning_slot, cls.afternoon_slot, cls.evening_slot],
             max_daily_work_minutes=480,  # 8 hours
             max_weekly_work_minutes=2400  # 40 hours
         )
+    
+    def setUp(self):
+        # Create test tasks; tests may change them (and the schedule), so
+        # each test gets fresh ones
+        self.task1 = Task(
+            id="task1",
+            title="Task 1",
+            description="Description 1",
+            duration=60,  # 1 hour
+            energy_cost=3,
+            category=TaskCategory.WORK,
+            priority=3,
+            deadline=None,
+            status=TaskStatus.TODO
+        )
+        
+        self.task2 = Task(
+            id="task2",
+            title="Task 2",
+            description="Description 2",
+            duration=120,  # 2 hours
+            energy_cost=5,
+            category=TaskCategory.HEALTH,
+            priority=4,
+            deadline=None,
+            status=TaskStatus.TODO
+        )
         
         # Create test schedule
         self.schedule = Schedule(
             id="sched1",
             name="Test Schedule",
-            start_date=datetime.now(),
-            end_date=datetime.now() + timedelta(days=7),
+            start_date=FIXED_NOW,
+            end_date=FIXED_END,
             objective_scores={},
             pareto_rank=0,
             is_dominated=False
@@ -409,6 +376,296 @@ class TestSchedulerFunctions(unittest.TestCase):
         
         # Health objective should be higher than work objective
         self.assertTrue(scores["obj2"] > scores["obj1"])
+    
+    def test_generated_scores_match_batch_scores(self):
+        """Test that per-schedule and batch scoring agree, including a zero target"""
+        zero_target = Objective(
+            id="obj0",
+            name="Open-Ended Objective",
+            category=TaskCategory.WORK,
+            target_value=0.0,
+            current_value=0.0,
+            weight=0.1,
+            measurement_unit="hours",
+            time_frame=TimeFrame.WEEKLY
+        )
+        objectives = [self.objective1, self.objective2, zero_target]
+        
+        scores = calculate_generated_scores(self.schedule, objectives)
+        batch = _objective_score_matrix([self.schedule], objectives)
+        
+        for objective, batch_score in zip(objectives, batch[0].tolist()):
+            self.assertAlmostEqual(scores[objective.id], batch_score)
+        self.assertEqual(scores["obj0"], 1.0)
+    
+    def test_calculate_weighted_scores(self):
+        """Test batch weighted scoring against the per-schedule version"""
+        weights = {"obj1": 0.25, "obj2": 0.75}
+        scores = {
+            "s1": {"obj1": 0.8, "obj2": 0.4},
+            "s2": {"obj1": 0.2, "obj3": 0.9},  # obj3 has no weight, obj2 no score
+        }
+        
+        weighted = calculate_weighted_scores(scores, weights)
+        
+        self.assertEqual(list(weighted), ["s1", "s2"])
+        for schedule_id, schedule_scores in scores.items():
+            self.assertAlmostEqual(weighted[schedule_id],
+                                   calculate_weighted_score(schedule_scores, weights))
+    
+    def test_generated_schedules_respect_dependencies(self):
+        """Test that generated schedules start tasks after their dependencies"""
+        # The higher priority task waits for the lower priority one
+        self.task2.dependencies = [self.task1]
+        
+        schedules = generate_feasible_schedules(
+            [self.task1, self.task2], [self.objective1, self.objective2], self.constraints
+        )
+        
+        # Placing by priority alone would break the dependency
+        self.assertIn("Priority-Focused Schedule", [schedule.name for schedule in schedules])
+        for schedule in schedules:
+            starts = schedule.task_start_times
+            if self.task2.id in starts:
+                self.assertIn(self.task1.id, starts)
+                self.assertGreaterEqual(starts[self.task2.id],
+                                        starts[self.task1.id] + timedelta(minutes=self.task1.duration))
+    
+    def test_generated_tasks_never_overlap(self):
+        """Test that overlapping slots don't double-book time"""
+        # Two overlapping morning slots, and a slot running up to midnight next
+        # to the following day's early one, on every day
+        slots = []
+        for day in DayOfWeek:
+            slots += [
+                TimeSlot(day=day, start_time=time(9, 0), end_time=time(12, 0)),
+                TimeSlot(day=day, start_time=time(10, 0), end_time=time(13, 0)),
+                TimeSlot(day=day, start_time=time(22, 0), end_time=time(0, 0)),
+                TimeSlot(day=day, start_time=time(0, 0), end_time=time(3, 0)),
+            ]
+        constraints = TimeConstraints(available_slots=slots, max_daily_work_minutes=1440,
+                                      max_weekly_work_minutes=10080)
+        
+        tasks = [
+            Task(id=f"overlap{i}", title=f"Task {i}", description="", duration=60 + 30 * (i % 3),
+                 energy_cost=1, category=TaskCategory.WORK, priority=i % 5, deadline=None,
+                 status=TaskStatus.TODO)
+            for i in range(40)
+        ]
+        
+        schedules = generate_feasible_schedules(tasks, [self.objective1], constraints)
+        self.assertTrue(schedules)
+        
+        durations = {task.id: task.duration for task in tasks}
+        for schedule in schedules:
+            intervals = sorted(
+                (start, start + timedelta(minutes=durations[task_id]))
+                for task_id, start in schedule.task_start_times.items()
+            )
+            for (_, end), (next_start, _) in zip(intervals, intervals[1:]):
+                self.assertLessEqual(end, next_start, schedule.name)
+    
+    def test_check_time_slot_overlap(self):
+        """Test overlap detection between time slots given in minutes"""
+        self.assertFalse(check_time_slot_overlap([(30, 90), (120, 180)]))
+        self.assertTrue(check_time_slot_overlap([(30, 90), (60, 120)]))
+        # Touching slots don't overlap
+        self.assertFalse(check_time_slot_overlap([(30, 90), (90, 150)]))
+        # A long slot overlapping a later, non-adjacent one
+        self.assertTrue(check_time_slot_overlap([(0, 100), (10, 20), (30, 40)]))
+        
+        # Large inputs take the vectorized path and must agree
+        many_slots = [(i * 60, i * 60 + 30) for i in range(100)]
+        self.assertFalse(check_time_slot_overlap(many_slots))
+        self.assertTrue(check_time_slot_overlap(many_slots + [(15, 45)]))
+        
+        # Epoch milliseconds don't fit in 32 bits; both paths must agree on
+        # them, including an overlap across a point where int32 would wrap
+        hour = 3_600_000
+        wrap = 2 ** 32 * 400 + 2 ** 31
+        base = wrap - 20 * hour - hour // 4
+        epoch_slots = [(base + i * hour, base + i * hour + hour // 2) for i in range(40)]
+        cases = [epoch_slots, epoch_slots + [(wrap, wrap + hour // 8)], epoch_slots + [(base - hour, base)]]
+        expected = [False, True, False]
+        
+        for slots, overlaps in zip(cases, expected):
+            self.assertEqual(check_time_slot_overlap(slots), overlaps)
+            with patch("backend.app.core.scheduler._VECTORIZE_MIN_SLOTS", len(slots) + 1):
+                self.assertEqual(check_time_slot_overlap(slots), overlaps)
+
+class TestScheduleQueries(unittest.TestCase):
+    """Guard the schedule reads against N+1 query regressions"""
+    
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        
+        start = datetime(2024, 1, 1)
+        links = []
+        for i in range(5):
+            first = Task(id=f"task{i}a", title=f"Task {i}a", duration=30, energy_cost=1,
+                         category=TaskCategory.WORK, priority=1)
+            second = Task(id=f"task{i}b", title=f"Task {i}b", duration=30, energy_cost=1,
+                          category=TaskCategory.HEALTH, priority=1, dependencies=[first])
+            schedule = Schedule(id=f"sched{i}", name=f"Schedule {i}", start_date=start,
+                                end_date=start + timedelta(days=6))
+            self.db.add_all([first, second, schedule])
+            links += [{"schedule_id": schedule.id, "task_id": task.id, "start_time": start}
+                      for task in (first, second)]
+        self.db.flush()
+        self.db.execute(schedule_tasks.insert(), links)
+        self.db.commit()
+        self.db.expunge_all()
+    
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+    
+    def _touch(self, schedules):
+        """Read every relationship the API serializes"""
+        for schedule in schedules:
+            for task in schedule.tasks:
+                list(task.dependencies)
+    
+    def test_get_schedules_query_count(self):
+        """Listing schedules loads tasks and dependencies in one query each"""
+        with count_queries(self.engine) as statements:
+            schedules = ScheduleService.get_schedules(self.db)
+            self._touch(schedules)
+        
+        self.assertEqual(len(schedules), 5)
+        self.assertLessEqual(len(statements), 3)
+    
+    def test_get_schedule_query_count(self):
+        """Reading one schedule doesn't lazy load per task"""
+        with count_queries(self.engine) as statements:
+            schedule = ScheduleService.get_schedule(self.db, "sched0")
+            self._touch([schedule])
+        
+        self.assertEqual(len(schedule.tasks), 2)
+        self.assertLessEqual(len(statements), 3)
+    
+    def test_check_schedule_feasibility_query_count(self):
+        """The feasibility check fetches the schedule once"""
+        constraints = TimeConstraints(available_slots=[
+            TimeSlot(day=day, start_time=time(0, 0), end_time=time(23, 59)) for day in DayOfWeek
+        ])
+        
+        with count_queries(self.engine) as statements:
+            ScheduleService.check_schedule_feasibility(self.db, "sched0", constraints)
+        
+        self.assertLessEqual(len(statements), 3)
+        self.assertIsNone(ScheduleService.check_schedule_feasibility(self.db, "missing", constraints))
+
+class TestParetoFrontMaintenance(unittest.TestCase):
+    """Incremental front updates must match a full recompute"""
+    
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+    
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+    
+    def _insert(self, schedule_id, score1, score2):
+        schedule = make_schedule(schedule_id, f"Schedule {schedule_id}", {"m1": score1, "m2": score2})
+        self.db.add(schedule)
+        self.db.flush()
+        ScheduleService._add_to_front(self.db, schedule)
+        return schedule
+    
+    def _assert_front_matches(self):
+        """
+        Front flags equal a brute-force front, and every dominator pointer names
+        a schedule that dominates it (evicting a dominator can leave a chain,
+        which is still valid since dominance is transitive)
+        """
+        schedules = {schedule.id: schedule for schedule in self.db.query(Schedule).all()}
+        
+        for schedule in schedules.values():
+            expected = any(is_dominated(schedule, other) for other in schedules.values())
+            self.assertEqual(schedule.is_dominated, expected, schedule.id)
+            
+            if expected:
+                self.assertTrue(is_dominated(schedule, schedules[schedule.dominator_id]))
+            else:
+                self.assertIsNone(schedule.dominator_id)
+    
+    def test_insert(self):
+        """New schedules join the front or get a dominator, and evict what they dominate"""
+        self._insert("a", 0.5, 0.5)
+        self._insert("b", 0.8, 0.2)
+        self._assert_front_matches()
+        
+        self._insert("c", 0.6, 0.6)  # Dominates A
+        self._insert("d", 0.1, 0.1)  # Dominated by everything
+        self._assert_front_matches()
+        self.assertEqual(self.db.get(Schedule, "a").dominator_id, "c")
+    
+    def test_delete_dominator(self):
+        """Deleting a dominator re-places the schedules that pointed at it"""
+        self._insert("a", 0.5, 0.5)
+        self._insert("b", 0.8, 0.2)
+        self._insert("c", 0.6, 0.6)
+        self._insert("d", 0.55, 0.3)  # Dominated by C only
+        self.db.commit()
+        
+        self.assertTrue(ScheduleService.delete_schedule(self.db, "c"))
+        self._assert_front_matches()
+        self.assertFalse(self.db.get(Schedule, "a").is_dominated)
+    
+    def test_update(self):
+        """Rescoring a schedule moves it and the schedules it dominated"""
+        self._insert("a", 0.5, 0.5)
+        self._insert("b", 0.8, 0.2)
+        c = self._insert("c", 0.6, 0.6)
+        
+        # C drops below A: A returns to the front
+        c.objective_scores = {"m1": 0.4, "m2": 0.4}
+        ScheduleService._add_to_front(self.db, c)
+        ScheduleService._recheck_dominated_by(self.db, c.id)
+        self._assert_front_matches()
+        
+        # B rises above everything
+        b = self.db.get(Schedule, "b")
+        b.objective_scores = {"m1": 0.9, "m2": 0.9}
+        ScheduleService._add_to_front(self.db, b)
+        ScheduleService._recheck_dominated_by(self.db, b.id)
+        self._assert_front_matches()
+        
+        # Deleting A, which C still points at, re-places C
+        self.assertEqual(self.db.get(Schedule, "c").dominator_id, "a")
+        self.assertTrue(ScheduleService.delete_schedule(self.db, "a"))
+        self._assert_front_matches()
+        self.assertEqual(
+            [schedule.id for schedule in self.db.query(Schedule).filter(Schedule.is_dominated.is_(False))],
+            ["b"]
+        )
+
+class TestSchemaUpgrade(unittest.TestCase):
+    def test_add_missing_columns(self):
+        """Tables created before dominator_id existed get the column and its index"""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE schedules (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL, "
+                "start_date DATETIME NOT NULL, end_date DATETIME NOT NULL, objective_scores JSON, "
+                "pareto_rank INTEGER, is_dominated BOOLEAN)"
+            ))
+        
+        add_missing_columns(engine)
+        Base.metadata.create_all(engine)
+        
+        inspector = inspect(engine)
+        self.assertIn("dominator_id", [column["name"] for column in inspector.get_columns("schedules")])
+        self.assertIn("ix_schedules_dominator_id", [index["name"] for index in inspector.get_indexes("schedules")])
+        
+        # Running it again on an up-to-date database changes nothing
+        add_missing_columns(engine)
+        engine.dispose()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Lets pytest import the backend package from the repository root, the same
+# way `python -m backend.tests.test_core` does